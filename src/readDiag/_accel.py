@@ -0,0 +1,24 @@
+# ---------------------------------------------------------------------------
+# Lazy access to the optional Numba kernels
+# ---------------------------------------------------------------------------
+"""
+Lazy loader for :mod:`readDiag._kernels`.
+
+Numba is an optional dependency and slow to import, so the kernels module is
+only imported the first time a hot path asks for it.
+"""
+from typing import Any
+
+_kernels_module: Any = None
+
+
+def get_kernels() -> Any:
+    """Return the Numba kernels module, or None if Numba is not installed."""
+    global _kernels_module
+    if _kernels_module is None:
+        try:
+            from . import _kernels as mod
+        except ImportError:
+            mod = False
+        _kernels_module = mod
+    return _kernels_module or None
@@ -0,0 +1,140 @@
+# ---------------------------------------------------------------------------
+# Optional Numba kernels for the hot numeric paths of readDiag
+# ---------------------------------------------------------------------------
+"""
+Numba-compiled kernels used by readDiag when Numba is installed.
+
+Importing this module raises ImportError if Numba is not available; callers
+are expected to import it lazily and fall back to their NumPy implementation.
+"""
+import numpy as np
+from numba import get_num_threads, njit, prange
+
+
+@njit(parallel=True, cache=True)
+def _fused_hist(values, lo, hi, nbins, nthreads):
+    local = np.zeros((nthreads, nbins), np.int64)
+    inv_dx = nbins / (hi - lo)
+    n = values.size
+    chunk = (n + nthreads - 1) // nthreads
+    for t in prange(nthreads):
+        stop = min(n, (t + 1) * chunk)
+        for i in range(t * chunk, stop):
+            x = values[i]
+            # NaNs fail both comparisons and are skipped
+            if not (x >= lo and x <= hi):
+                continue
+            idx = int((x - lo) * inv_dx)
+            if idx >= nbins:
+                idx = nbins - 1
+            local[t, idx] += 1
+    return local.sum(axis=0)
+
+
+def fused_hist(values: np.ndarray, lo: float, hi: float, nbins: int) -> np.ndarray:
+    """Count values into ``nbins`` equal bins over ``[lo, hi]`` in a single pass.
+
+    NaNs and values outside the range are skipped, so no separate NaN-drop
+    pass is needed. The last bin is closed on the right, as in `np.histogram`.
+
+    Args:
+        values (np.ndarray): 1-D array of values.
+        lo (float): Lower edge of the first bin.
+        hi (float): Upper edge of the last bin.
+        nbins (int): Number of bins.
+
+    Returns:
+        np.ndarray: Counts per bin (int64).
+    """
+    return _fused_hist(values, lo, hi, nbins, get_num_threads())
+
+
+@njit(cache=True)
+def bin_by_kx(kx):
+    """Group observation indices by kx with a stable two-pass counting sort.
+
+    Args:
+        kx (np.ndarray): 1-D integer array of kx values (non-empty).
+
+    Returns:
+        tuple: ``(unique, starts, perm)`` where ``unique`` holds the sorted kx
+        values, ``perm`` orders the rows by kx (keeping file order within a
+        kx) and rows of ``unique[i]`` are ``perm[starts[i]:starts[i + 1]]``.
+    """
+    n = kx.size
+    lo = kx.min()
+    span = kx.max() - lo + 1
+    counts = np.zeros(span, np.int64)
+    for i in range(n):
+        counts[kx[i] - lo] += 1
+    nuniq = 0
+    for v in range(span):
+        if counts[v]:
+            nuniq += 1
+    unique = np.empty(nuniq, kx.dtype)
+    starts = np.empty(nuniq + 1, np.int64)
+    offsets = np.empty(span, np.int64)
+    j = 0
+    pos = 0
+    for v in range(span):
+        if counts[v]:
+            unique[j] = v + lo
+            starts[j] = pos
+            offsets[v] = pos
+            pos += counts[v]
+            j += 1
+    starts[nuniq] = n
+    perm = np.empty(n, np.int64)
+    for i in range(n):
+        v = kx[i] - lo
+        perm[offsets[v]] = i
+        offsets[v] += 1
+    return unique, starts, perm
+
+
+@njit(cache=True)
+def _be_i4(buf, pos):
+    v = (np.int64(buf[pos]) << 24) | (np.int64(buf[pos + 1]) << 16) \
+        | (np.int64(buf[pos + 2]) << 8) | np.int64(buf[pos + 3])
+    return v - (np.int64(1) << 32) if v >= (np.int64(1) << 31) else v
+
+
+@njit(cache=True)
+def scan_conv_blocks(buf, pos):
+    """Walk the block stream of a conventional diag file held in a byte buffer.
+
+    Each block is a 31-byte header (head, var[3], nchar, ninfo, nobs, mype,
+    tail, tail2; big-endian) followed by an ``eh, cb[nobs], rb[nobs, ninfo],
+    et`` data record, or by a bare 4-byte marker when ``nobs`` is 0.
+
+    Args:
+        buf (np.ndarray): uint8 view of the whole file.
+        pos (int): Offset of the first block header.
+
+    Returns:
+        np.ndarray: int64 array of shape (nblocks, 4) with ``nobs``, ``ninfo``,
+        the data record offset and the offset of the 3-byte variable name, for
+        every block with observations.
+    """
+    n = buf.size
+    out = np.empty((64, 4), np.int64)
+    nb = 0
+    while pos + 31 <= n:
+        ninfo = _be_i4(buf, pos + 11)
+        nobs = _be_i4(buf, pos + 15)
+        var_pos = pos + 4
+        pos += 31
+        if nobs > 0:
+            if nb == out.shape[0]:
+                grown = np.empty((2 * nb, 4), np.int64)
+                grown[:nb] = out
+                out = grown
+            out[nb, 0] = nobs
+            out[nb, 1] = ninfo
+            out[nb, 2] = pos
+            out[nb, 3] = var_pos
+            nb += 1
+            pos += 8 + 8 * nobs + 4 * nobs * ninfo
+        else:
+            pos += 4
+    return out[:nb]
@@ -6,16 +6,20 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional, Iterable, List, Dict, Any
+from typing import Optional, Iterable, List, Dict, Any, Tuple, Union, IO
 from collections import Counter, defaultdict
+import functools
 import warnings
+import weakref
 import matplotlib as mpl
 import matplotlib.colors as mcolors
 import matplotlib.pyplot as plt
 from matplotlib import cm
+from matplotlib.figure import Figure
 import numpy as np
 import pandas as pd
 
+from ._accel import get_kernels
 from .reader import diagAccess
 from .style import PlotConfig
 
@@ -34,6 +38,182 @@ def _check_kind(kind: str):
     return decorator
 
 
+# Integer bin counts above this bound are treated as pathological for rendering
+_MAX_HIST_BINS = 512
+# Figure width (inches) per x-axis category for figures sized by the plotter
+_CATEGORY_WIDTH = 0.3
+# Arrays larger than this are binned in single precision
+_HIST_DOWNCAST_SIZE = 1_000_000
+# Arrays larger than this use the fused Numba kernel when available
+_FUSED_HIST_SIZE = 500_000
+# `Axes.boxplot` keywords that `Axes.bxp` does not accept
+_BOXPLOT_ONLY_KEYS = {"notch", "sym", "bootstrap", "usermedians", "conf_intervals",
+                      "autorange", "labels", "tick_labels"}
+
+
+def _caller_stacklevel() -> int:
+    """Return the `warnings.warn` stacklevel of the first frame outside this module.
+
+    Meant to be called from the function that warns, so the warning points at
+    the user's call site however many internal wrappers sit in between.
+    """
+    frame, level = sys._getframe(1), 1
+    while frame is not None and frame.f_globals.get("__name__") == __name__:
+        frame, level = frame.f_back, level + 1
+    return level
+
+
+def _hist_fast(values: np.ndarray,
+               bins: Any = 50,
+               hist_range: Optional[tuple] = None,
+               weights: Optional[np.ndarray] = None) -> tuple:
+    """Compute histogram counts and bin edges for a 1-D array, ignoring NaNs.
+
+    Integer bin requests above ``_MAX_HIST_BINS`` that would leave fewer than
+    50 samples per bin are clamped to ``max(10, sqrt(N))``, since the number of
+    bar artists dominates Matplotlib draw time. Large float64 inputs are
+    binned as float32 to halve the memory traffic of the binning loop, and
+    very large unweighted inputs are binned by a fused NaN-skipping Numba
+    kernel when Numba is installed.
+
+    Args:
+        values (np.ndarray): Values to bin; NaNs are skipped.
+        bins (Any): Number of bins, bin edges or a NumPy binning strategy name.
+        hist_range (Optional[tuple]): Lower and upper range of the bins.
+        weights (Optional[np.ndarray]): Optional weights for each value.
+
+    Returns:
+        tuple: ``(counts, edges)`` as returned by `np.histogram`.
+    """
+    int_bins = isinstance(bins, (int, np.integer))
+    if int_bins and bins > _MAX_HIST_BINS and values.size < bins * 50:
+        capped = min(int(bins), max(10, int(np.sqrt(values.size))))
+        warnings.warn(f"bins={bins} is too large for {values.size} values; "
+                      f"using bins={capped} instead", RuntimeWarning,
+                      stacklevel=_caller_stacklevel())
+        bins = capped
+    if values.dtype == np.float64 and values.size > _HIST_DOWNCAST_SIZE:
+        # double precision is not needed for a screen histogram
+        values = values.astype(np.float32, copy=False)
+    fused = (int_bins and weights is None and values.size > _FUSED_HIST_SIZE
+             and get_kernels() is not None)
+    if not fused:
+        values, weights = _drop_nan(values, weights)
+    if int_bins and hist_range is None and values.size:
+        # one min/max reduction, passed on so the binning step needs no rescan
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            hist_range = (float(np.nanmin(values)), float(np.nanmax(values)))
+    if fused:
+        if hist_range is not None and np.isfinite(hist_range).all():
+            lo, hi = float(hist_range[0]), float(hist_range[1])
+            if lo == hi:
+                lo, hi = lo - 0.5, hi + 0.5
+            counts = get_kernels().fused_hist(values, lo, hi, int(bins))
+            return counts, np.linspace(lo, hi, int(bins) + 1)
+        # all-NaN input: let NumPy build its default empty histogram
+        values, weights = _drop_nan(values, weights)
+        if not values.size:
+            hist_range = None
+    return np.histogram(values, bins=bins, range=hist_range, weights=weights)
+
+
+def _drop_nan(values: np.ndarray, weights: Optional[np.ndarray]) -> tuple:
+    """Remove NaNs from float values (and the matching weights)."""
+    if values.dtype.kind != "f":
+        return values, weights
+    keep = ~np.isnan(values)
+    if weights is not None:
+        weights = np.asarray(weights)[keep]
+    return values[keep], weights
+
+
+# NumPy reductions matching pandas Series semantics: (function, minimum size)
+_NP_AGG: Dict[str, tuple] = {
+    "mean": (functools.partial(np.mean, dtype=np.float64), 1),
+    "median": (np.median, 1),
+    "min": (np.min, 1),
+    "max": (np.max, 1),
+    "sum": (functools.partial(np.sum, dtype=np.float64), 0),
+    "count": (np.size, 0),
+    "std": (functools.partial(np.std, ddof=1, dtype=np.float64), 2),
+    "var": (functools.partial(np.var, ddof=1, dtype=np.float64), 2),
+}
+
+
+def _aggregate(a: np.ndarray, agg: str) -> float:
+    """Reduce a NaN-free array with a pandas-style aggregation name.
+
+    Common reductions run directly on the NumPy array; other names fall back
+    to the corresponding `pd.Series` method.
+
+    Args:
+        a (np.ndarray): Values to aggregate.
+        agg (str): Aggregation name ('mean', 'std', ...).
+
+    Returns:
+        float: Aggregated value (NaN when too few values are available).
+    """
+    if agg not in _NP_AGG:
+        return getattr(pd.Series(a), agg)()
+    fn, min_size = _NP_AGG[agg]
+    return fn(a) if a.size >= min_size else np.nan
+
+
+def _quartiles(a: np.ndarray) -> tuple:
+    """Return min, quartiles and max of a 1-D array without a full sort.
+
+    Uses `np.partition` to select the three order statistics in O(N).
+
+    Args:
+        a (np.ndarray): Non-empty array of values (NaNs already removed).
+
+    Returns:
+        tuple: ``(min, q1, median, q3, max)``.
+    """
+    n = a.size
+    ks = [n // 4, n // 2, (3 * n) // 4]
+    p = np.partition(a, ks)
+    return a.min(), p[ks[0]], p[ks[1]], p[ks[2]], a.max()
+
+
+def _bxp_stats(a: np.ndarray, label: Any = None, whis: Any = 1.5) -> Dict[str, Any]:
+    """Build a statistics dict suitable for `Axes.bxp`.
+
+    Whiskers follow the `Axes.boxplot` convention: they extend to the most
+    extreme values within ``whis`` times the interquartile range, or within
+    the ``(low, high)`` percentiles when ``whis`` is a pair.
+
+    Args:
+        a (np.ndarray): Values for one box (NaNs already removed).
+        label (Any): Label for the box.
+        whis (Any): Whisker length in units of the interquartile range, or a
+            pair of percentiles.
+
+    Returns:
+        Dict[str, Any]: Box statistics (mean, med, q1, q3, whislo, whishi, fliers, ...).
+    """
+    if a.size == 0:
+        nan = np.nan
+        return dict(label=label, mean=nan, med=nan, q1=nan, q3=nan, whislo=nan,
+                    whishi=nan, cilo=nan, cihi=nan, fliers=np.empty(0))
+    lo, q1, med, q3, hi = _quartiles(a)
+    iqr = q3 - q1
+    if np.iterable(whis):
+        lo_fence, hi_fence = np.percentile(a, whis)
+    else:
+        lo_fence, hi_fence = q1 - whis * iqr, q3 + whis * iqr
+    if lo < lo_fence or hi > hi_fence:
+        inside = (a >= lo_fence) & (a <= hi_fence)
+        whislo, whishi = a[inside].min(), a[inside].max()
+        fliers = a[~inside]
+    else:
+        whislo, whishi, fliers = lo, hi, np.empty(0)
+    notch = 1.57 * iqr / np.sqrt(a.size)
+    return dict(label=label, mean=a.mean(), med=med, q1=q1, q3=q3, whislo=whislo,
+                whishi=whishi, cilo=med - notch, cihi=med + notch, fliers=fliers)
+
+
 # apply global config
 _default_config = PlotConfig()
 plt.style.use(_default_config.style)
@@ -56,6 +236,10 @@ class diagPlotter:
     Note:
         The `color` argument is NOT part of the style configuration and must be passed directly to the plot function.
 
+        Scripts that save many similar plots can set ``diagPlotter.recycle_figures = True``
+        so that figures created internally are reused after each save; the Axes returned by
+        a previous call is then cleared by the next one. Call `close_all_pooled()` when done.
+
     Example:
         >>> from mypackage.reader import diagAccess
         >>> from mypackage.plotting import diagPlotter
@@ -89,10 +273,20 @@ class diagPlotter:
         self.config = config or _default_config
 
 
-    @staticmethod
-    def _ensure_ax(ax: Optional[plt.Axes]) -> plt.Axes:
+    # Figures created by _ensure_ax, and the idle ones available for reuse
+    _FIG_OWNED: "weakref.WeakSet[Figure]" = weakref.WeakSet()
+    _FIG_POOL: List[Tuple[Figure, plt.Axes]] = []
+    _FIG_POOL_SIZE: int = 4
+    #: When True, figures created internally are recycled after being saved.
+    recycle_figures: bool = False
+
+    @classmethod
+    def _ensure_ax(cls, ax: Optional[plt.Axes]) -> plt.Axes:
         """Return existing Axes or create a new one.
 
+        When `recycle_figures` is enabled, a previously saved figure is taken
+        from the internal pool and cleared instead of building a new one.
+
         Args:
             ax (Optional[plt.Axes]): Existing axes or None.
 
@@ -100,22 +294,64 @@ class diagPlotter:
             plt.Axes: Matplotlib Axes.
         """
         if ax is None:
-            fig, ax = plt.subplots()
+            if cls._FIG_POOL:
+                fig, ax = cls._FIG_POOL.pop()
+                ax.clear()
+                fig.set_size_inches(mpl.rcParams["figure.figsize"])
+            else:
+                fig, ax = plt.subplots(layout="constrained")
+                cls._FIG_OWNED.add(fig)
         return ax
 
-    @staticmethod
-    def _save(ax: plt.Axes, savepath: Optional[str]) -> None:
-        """Save the figure to disk if a save path is provided.
+    @classmethod
+    def _save(cls, ax: plt.Axes, savepath: Optional[Union[str, IO[bytes]]],
+              ncat: int = 0, recycle: bool = True) -> None:
+        """Save the figure if a save path or writable binary file is provided.
+
+        Figures created by the plotter use a constrained layout and are widened
+        from the number of plotted categories, so they are saved without
+        ``bbox_inches='tight'`` and its extra render pass. Figures supplied by
+        the caller are still saved with a tight bounding box.
 
         Args:
             ax (plt.Axes): The axes containing the figure.
-            savepath (Optional[str]): File path to save the figure.
+            savepath (Optional[Union[str, IO[bytes]]]): File path to save the
+                figure, or a binary file-like object (e.g. ``io.BytesIO``) that
+                receives it as PNG.
+            ncat (int): Number of categories along the x axis (kxs, channels).
+            recycle (bool): Whether the figure may go back to the figure pool.
+                Figures carrying figure-level state (e.g. a suptitle) must not.
         """
+        fig = ax.get_figure()
+        owned = fig in cls._FIG_OWNED
+        if owned and ncat:
+            width = max(mpl.rcParams["figure.figsize"][0], _CATEGORY_WIDTH * ncat)
+            fig.set_size_inches(width, fig.get_figheight())
         if not savepath:
             return
-        p = Path(savepath)
-        p.parent.mkdir(parents=True, exist_ok=True)
-        ax.get_figure().savefig(p, dpi=150, bbox_inches="tight")
+        if hasattr(savepath, "write"):
+            # file-like sink: nothing to create, and no name to infer a format from
+            target, fmt = savepath, "png"
+        else:
+            target, fmt = Path(savepath), None
+            target.parent.mkdir(parents=True, exist_ok=True)
+        if owned:
+            with mpl.rc_context({"savefig.bbox": "standard"}):
+                fig.savefig(target, format=fmt, dpi=150, pad_inches=0.1)
+        else:
+            fig.savefig(target, format=fmt, dpi=150, bbox_inches="tight")
+        if (recycle and cls.recycle_figures and owned and len(fig.axes) == 1
+                and len(cls._FIG_POOL) < cls._FIG_POOL_SIZE
+                and all(f is not fig for f, _ in cls._FIG_POOL)):
+            cls._FIG_POOL.append((fig, ax))
+
+    @classmethod
+    def close_all_pooled(cls) -> None:
+        """Close every figure held in the internal figure pool."""
+        while cls._FIG_POOL:
+            fig, _ = cls._FIG_POOL.pop()
+            cls._FIG_OWNED.discard(fig)
+            plt.close(fig)
 
     def _apply_plot_kwargs(self, ax: plt.Axes, style_kwargs: Dict[str, Any]) -> plt.Axes:
         """Apply common styling keyword arguments to the axes (titles, labels, font sizes).
@@ -206,7 +442,7 @@ class diagPlotter:
         if col not in df.columns:
             raise ValueError(f"Column '{col}' not in data frame.")
     
-        values = df[col].dropna().to_numpy()
+        values = df[col].to_numpy()
         ax = self._ensure_ax(ax)
     
         # --- Separe kwargs em dados vs. estilo, mas mantenha color/alpha em dados ---
@@ -217,7 +453,10 @@ class diagPlotter:
                 data_kwargs[key] = style_kwargs.pop(key)
     
         # --- Plota e captura patches ---
-        _, _, patches = ax.hist(values, bins=bins, **data_kwargs)
+        counts, edges = _hist_fast(values, bins,
+                                   hist_range=data_kwargs.pop("range", None),
+                                   weights=data_kwargs.pop("weights", None))
+        _, _, patches = ax.hist(edges[:-1], bins=edges, weights=counts, **data_kwargs)
     
         # redundância segura: se color/alpha foram passados, força nos patches
         color = data_kwargs.get("color", None)
@@ -261,23 +500,29 @@ class diagPlotter:
             raise ValueError(f"Variable '{var}' not found.")
 
         kxs = sorted(data_dict[var].keys())
-        series_list: List[Iterable[float]] = []
+        series_list: List[np.ndarray] = []
         for k in kxs:
-            df = data_dict[var][k]
-            if col not in df.columns:
+            s = data_dict[var][k].get(col)
+            if s is None:
                 raise ValueError(f"Column '{col}' not in data for kx {k}.")
-            series_list.append(df[col].dropna().to_numpy())
+            series_list.append(_drop_nan(s.to_numpy(), None)[0])
 
         ax = self._ensure_ax(ax)
         data_kwargs, style_kwargs = self._split_kwargs(kwargs)
-        ax.boxplot(series_list, **data_kwargs)
+        if _BOXPLOT_ONLY_KEYS & data_kwargs.keys():
+            # options that change the statistics themselves: let Matplotlib compute them
+            ax.boxplot(series_list, **data_kwargs)
+        else:
+            whis = data_kwargs.pop("whis", 1.5)
+            stats = [_bxp_stats(a, k, whis) for a, k in zip(series_list, kxs)]
+            ax.bxp(stats, **data_kwargs)
         ax.set_xticks(range(1, len(kxs)+1))
         ax.set_xticklabels(kxs)
         style_kwargs.setdefault("title", f"Boxplot of {col} for {var} across kxs")
         style_kwargs.setdefault("xlabel", "KX")
         style_kwargs.setdefault("ylabel", col)
         self._apply_plot_kwargs(ax, style_kwargs)
-        self._save(ax, savepath)
+        self._save(ax, savepath, ncat=len(kxs))
         return ax
 
 
@@ -327,7 +572,7 @@ class diagPlotter:
         style_kwargs.setdefault("rotation", 45)
     
         self._apply_plot_kwargs(ax, style_kwargs)
-        self._save(ax, savepath)
+        self._save(ax, savepath, ncat=len(kx))
         return ax
 
 
@@ -378,7 +623,7 @@ class diagPlotter:
 
         self._apply_plot_kwargs(ax, style_kwargs)
 
-        self._save(ax, savepath)
+        self._save(ax, savepath, ncat=len(ks))
         return ax
 
     @_check_kind("conv")
@@ -406,7 +651,7 @@ class diagPlotter:
         style_kwargs.setdefault("xlabel", "Variable")
         style_kwargs.setdefault("ylabel", "Count")
         self._apply_plot_kwargs(ax, style_kwargs)
-        self._save(ax, savepath)
+        self._save(ax, savepath, ncat=len(ks))
         return ax
         
     @_check_kind("conv")
@@ -477,7 +722,7 @@ class diagPlotter:
 
         ax.legend(title="Variable", fontsize=10)
 
-        self._save(ax, savepath)
+        self._save(ax, savepath, ncat=len(ks))
         return ax
         
     @_check_kind("conv")
@@ -592,7 +837,9 @@ class diagPlotter:
         if not chan_list:
             raise ValueError("No radiance channel data available.")
 
-        stats = [getattr(df[metric].dropna(), agg)() for df in chan_list if metric in df.columns]
+        arrays = (df.get(metric) for df in chan_list)
+        stats = [_aggregate(_drop_nan(s.to_numpy(), None)[0], agg)
+                 for s in arrays if s is not None]
         ax = self._ensure_ax(ax)
 
         data_kwargs, style_kwargs = self._split_kwargs(kwargs)
@@ -604,7 +851,7 @@ class diagPlotter:
         style_kwargs.setdefault("xlabel", "Channel")
         style_kwargs.setdefault("ylabel", f"{agg}({metric})")
         self._apply_plot_kwargs(ax, style_kwargs)
-        self._save(ax, savepath)
+        self._save(ax, savepath, ncat=len(stats))
         return ax
 
     @_check_kind("rad")
@@ -633,11 +880,14 @@ class diagPlotter:
             raise IndexError("Channel index out of range.")
         df = chan_list[channel_index]
         key = "omf_nbc" if corrected and "omf_nbc" in df.columns else "omf"
-        values = df[key].dropna().to_numpy()
+        values = df[key].to_numpy()
 
         ax = self._ensure_ax(ax)
         data_kwargs, style_kwargs = self._split_kwargs(kwargs)
-        ax.hist(values, bins=bins, **data_kwargs)
+        counts, edges = _hist_fast(values, bins,
+                                   hist_range=data_kwargs.pop("range", None),
+                                   weights=data_kwargs.pop("weights", None))
+        ax.hist(edges[:-1], bins=edges, weights=counts, **data_kwargs)
 
         style_kwargs.setdefault("title", f"O-F distribution for channel {channel_index}")
         style_kwargs.setdefault("xlabel", key)
@@ -646,6 +896,64 @@ class diagPlotter:
         self._save(ax, savepath)
         return ax
 
+    @_check_kind("rad")
+    def plot_omf_grid_rad(self,
+                          indices: Optional[Iterable[int]] = None,
+                          corrected: bool = False,
+                          bins: int = 50,
+                          ncols: int = 4,
+                          savepath: Optional[str] = None,
+                          **kwargs) -> np.ndarray:
+        """Plot O-F histograms for several radiance channels in a single figure.
+
+        All panels share one figure and one `savefig` call, which is much cheaper
+        than calling `plot_omf_distribution_rad` once per channel.
+
+        Args:
+            indices (Optional[Iterable[int]]): Channel indices to plot. If None, plots all channels.
+            corrected (bool): If True, use 'omf_nbc' if available.
+            bins (int): Number of bins per histogram.
+            ncols (int): Number of subplot columns.
+            savepath (Optional[str]): Path to save figure.
+            **kwargs: Additional keyword args for `Axes.hist` and styling keys
+                      (`title` is used as the figure title).
+
+        Returns:
+            np.ndarray: 2-D array of axes (unused panels are hidden).
+        """
+        chan_list = self.diag.get_data_frame().get("dataframes", {}).get("diagbufchan_df", [])
+        indices = list(range(len(chan_list))) if indices is None else list(indices)
+        if not indices:
+            raise ValueError("No radiance channels selected.")
+        for i in indices:
+            if i < 0 or i >= len(chan_list):
+                raise IndexError(f"Channel index {i} out of range.")
+
+        ncols = max(1, min(ncols, len(indices)))
+        nrows = -(-len(indices) // ncols)
+        fig, axes = plt.subplots(nrows, ncols, squeeze=False, layout="constrained",
+                                 figsize=(3.2 * ncols, 2.6 * nrows))
+        self._FIG_OWNED.add(fig)
+
+        data_kwargs, style_kwargs = self._split_kwargs(kwargs)
+        hist_range = data_kwargs.pop("range", None)
+        fontsize = style_kwargs.get("fontsize", 10)
+        for ax, i in zip(axes.flat, indices):
+            df = chan_list[i]
+            key = "omf_nbc" if corrected and "omf_nbc" in df.columns else "omf"
+            counts, edges = _hist_fast(df[key].to_numpy(), bins, hist_range=hist_range)
+            ax.hist(edges[:-1], bins=edges, weights=counts, **data_kwargs)
+            self._apply_plot_kwargs(ax, {"title": f"Channel {i}", "xlabel": key,
+                                         "fontsize": fontsize})
+        for ax in axes.flat[len(indices):]:
+            ax.set_visible(False)
+
+        fig.suptitle(style_kwargs.get("title", "O-F distribution per channel"),
+                     fontsize=fontsize + 2)
+        # a one-channel grid has a single Axes, but its suptitle must not leak into the pool
+        self._save(axes.flat[0], savepath, recycle=False)
+        return axes
+
     def pcount(self, *args, **kwargs):
         """Legacy alias for plot_observation_counts (deprecated)."""
         warnings.warn("pcount() is deprecated, use plot_observation_counts() instead", DeprecationWarning, stacklevel=2)
@@ -36,17 +36,24 @@ Includes optional memory-mapped reads, detailed logging, and parallel time-serie
 """
 import os
 from pathlib import Path
+import contextlib
+import mmap
 import struct
 import numpy as np
 import pandas as pd
+from pandas.api.types import union_categoricals
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, List, Tuple, Optional, Any, Union, IO
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Iterator, List, Tuple, Optional, Any, Union, IO
 import logging
 import time
 import functools
+import itertools
 from logging.handlers import RotatingFileHandler
 
+from ._accel import get_kernels
+
 # Timing decorator for performance logging
 def log_time(func):
     """Decorator to log execution time of class methods.
@@ -59,14 +66,18 @@ def log_time(func):
     """
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
+        # Skip timing and message formatting entirely when INFO is disabled
+        if not logger.isEnabledFor(logging.INFO):
+            return func(self, *args, **kwargs)
         start = time.perf_counter()
         result = func(self, *args, **kwargs)
-        duration = time.perf_counter() - start
-        logger.info(f"{func.__name__} completed in {duration:.3f}s")
+        logger.info("%s completed in %.3fs", func.__name__, time.perf_counter() - start)
         return result
     return wrapper
 
-# Configure module logger: console + rotating file handlers
+# Configure module logger: console, plus a rotating file when
+# DIAGACCESS_LOG_FILE names one (opt-in, so importing the module - e.g. in
+# read_time_series worker processes - opens no files)
 logger = logging.getLogger(__name__)
 if not logger.hasHandlers():
     formatter = logging.Formatter("%(asctime)s %(name)s %(levelname)s %(message)s")
@@ -76,17 +87,89 @@ if not logger.hasHandlers():
     console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
 
-    # File (rotates at 10 MB, keeps 5 backups)
-    file_handler = RotatingFileHandler(
-        "diagAccess.log", maxBytes=10 * 1024 * 1024, backupCount=5
-    )
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    # File (rotates at 10 MB, keeps 5 backups)
+    log_file = os.getenv("DIAGACCESS_LOG_FILE")
+    if log_file:
+        file_handler = RotatingFileHandler(
+            log_file, maxBytes=10 * 1024 * 1024, backupCount=5
+        )
+        file_handler.setFormatter(formatter)
+        logger.addHandler(file_handler)
+
+    # Our handlers already emit every record; don't repeat them through root
+    logger.propagate = False
 
 # Allow override via DIAGACCESS_LOG_LEVEL env var
 level = os.getenv("DIAGACCESS_LOG_LEVEL", "INFO").upper()
 logger.setLevel(getattr(logging, level, logging.INFO))
 
+def _to_native(a: np.ndarray) -> np.ndarray:
+    """Return `a` unchanged if native-endian, else a native-endian copy of it."""
+    return a if a.dtype.isnative else a.astype(a.dtype.newbyteorder('='))
+
+def _advise_sequential(f: IO[bytes], size: int) -> None:
+    """Hint the kernel that `f` is about to be read front to back.
+
+    Enlarges the read-ahead window and starts prefetching the whole file, so
+    cold-cache reads are throughput- rather than latency-bound. A no-op where
+    ``posix_fadvise`` is unavailable (e.g. Windows, macOS).
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = f.fileno()
+        os.posix_fadvise(fd, 0, size, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, size, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+
+def _map_sequential(f: IO[bytes]) -> np.memmap:
+    """Map `f` read-only as uint8 and advise sequential access where supported."""
+    mm = np.memmap(f, dtype=np.uint8, mode='r')
+    raw = getattr(mm, '_mmap', None)
+    if raw is not None and hasattr(mmap, 'MADV_SEQUENTIAL'):
+        try:
+            raw.madvise(mmap.MADV_SEQUENTIAL)
+        except OSError:
+            pass
+    return mm
+
+def _has_fileno(f: IO[bytes]) -> bool:
+    """Return True if `f` is backed by an OS file descriptor (False for e.g. io.BytesIO)."""
+    try:
+        f.fileno()
+    except (OSError, ValueError, AttributeError):
+        return False
+    return True
+
+def _read_whole(f: IO[bytes], size: int) -> np.ndarray:
+    """Read all of `f`, from its start, into a writable uint8 array."""
+    # np.empty skips the zero fill a bytearray would pay for
+    buf = np.empty(size, dtype=np.uint8)
+    f.seek(0)
+    return buf[:f.readinto(buf)]
+
+# Conventional column layouts, shared by every reader instance
+_CONV_BASE_COLUMNS: Tuple[str, ...] = (
+    'kx','lat','lon','elev','prs','dhgt','time','pbqc','emark',
+    'iusev','iuse','wpbqc','inp_err','adj_err','end_err','obs'
+)
+_CONV_SPEC_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    'q': ('omf','omf_wob','qsges'),
+    't': ('omf','omf_wob'),
+    'sst': ('omf',),
+    'uv': ('obs_u','omf_u','omf_wob_u','obs_v','omf_v','omf_wob_v','factw'),
+    'ps': ('omf','omf_wob'),
+    'gps': ('inc_ba','imp_height','zsges','trefges','hob','gps_ref','qrefges')
+}
+_SST_EXTRA_COLUMNS: Tuple[str, ...] = ('tref','dtw','dtc','tz')
+_T_AIRCRAFT_COLUMNS: Tuple[str, ...] = ('pof','wvv')
+_GPS_COLUMNS: Tuple[str, ...] = (
+    'kx','lat','lon','inc_ba','prs','imp_height','time','zsges',
+    'pbqc','iusev','iuse','wpbqc','inp_err','adj_err','end_err',
+    'obs','trefges','hob','gps_ref','qrefges'
+)
+
 class diagAccess:
     """
     Class to read and process GSI diagnostic files (conventional and radiance).
@@ -97,7 +180,8 @@ class diagAccess:
     Attributes:
         file_name (str): Path to the GSI diagnostic file.
         var (Optional[str]): Observation variable to filter when reading.
-        use_memmap (bool): Whether to use memory-mapped access for radiance data.
+        use_memmap (Optional[bool]): Whether to use memory-mapped access when reading
+            data; None (default) maps the file, False reads it into memory.
 
     Example:
         >>> from diagAccess import diagAccess
@@ -113,6 +197,18 @@ class diagAccess:
         ...     "diag_conv_ges.2023010112"
         ... ], var="uv")
     """
+    # Per-instance state lives in slots, not a __dict__; subclasses that do not
+    # declare __slots__ themselves get a __dict__ back for ad-hoc attributes
+    __slots__ = (
+        'file_name', 'var', 'use_memmap', 'use_arrow', 'udef', 'rtiny', '_data_type',
+        '_raw', '_frames', '_columns', '_idate', '_file_size'
+    )
+
+    # Conventional file header (marker, idate, marker) and block header
+    # (head, var, nchar, ninfo, nobs, mype, tail, tail2)
+    _CONV_FILE_HDR = struct.Struct('>3i')
+    _CONV_BLOCK_HDR = struct.Struct('>i3s6i')
+
     # Radiance dtype cache
     _dtypes_inited: bool = False
     header_diagbuf: List[str] = [
@@ -143,58 +239,95 @@ class diagAccess:
             ('varch','>f4'),('tlap','>f4'),('iuse','>i4'),('nuchan','>i4'),
             ('ich','>i4'),('tail','>i4')
         ])
+        # Native-endian mirror of the header: it is converted once at load time so
+        # pandas/NumPy never operate on byte-swapped data downstream
+        cls.native_header_info_dtype = cls.header_info_dtype.newbyteorder('=')
         cls._dtypes_inited = True
 
     @staticmethod
-    def _detect_format_file(file_name: str) -> str:
+    def _detect_format_file(f: IO[bytes]) -> str:
         """
         Detect the file format type (conventional or radiance).
 
+        The leading record marker is read and the handle rewound, so the same
+        open file can be passed on to the reader.
+
         Args:
-            file_name (str): Path to the diagnostic file.
+            f (IO[bytes]): Open diagnostic file, positioned at the start.
 
         Returns:
             str: 'conv' if conventional, 'rad' otherwise.
         """
-        with open(file_name, 'rb') as f:
-            val = struct.unpack('>I', f.read(4))[0]
+        val = int.from_bytes(f.read(4), 'big')
+        f.seek(0)
         return 'conv' if val == 4 else 'rad'
 
     def __init__(
         self,
-        file_name: str,
+        file_name: Union[str, IO[bytes]],
         var: Optional[str]=None,
-        use_memmap: bool=False
+        use_memmap: Optional[bool]=None,
+        use_arrow: bool=False
     ) -> None:
         """
         Initialize a diagAccess instance.
 
         Args:
-            file_name (str): Path to the GSI diagnostic file.
+            file_name (Union[str, IO[bytes]]): Path to the GSI diagnostic file, or
+                a seekable binary file-like object (e.g. ``io.BytesIO``) holding
+                its contents. Objects without a file descriptor are read into
+                memory whatever `use_memmap` says, and are not closed.
             var (Optional[str], optional): Variable of interest. Defaults to None.
-            use_memmap (bool, optional): Use memory-mapped reading. Defaults to False.
+            use_memmap (Optional[bool], optional): Use memory-mapped reading. None
+                (default) maps the file: radiance columns are then decoded on
+                access and conventional blocks are located by one scan over the
+                mapping. Pass False to read the file into memory, e.g. on
+                network filesystems where mapping is slow.
+            use_arrow (bool, optional): Return pyarrow-backed DataFrames (requires
+                pyarrow). Defaults to False.
 
         Raises:
             ValueError: If the file is too small or has an invalid header.
+            ImportError: If use_arrow is set and pyarrow is not installed.
         """
-        logger.info(f"Initializing diagAccess: file={file_name}, var={var}, use_memmap={use_memmap}")
-        size = os.path.getsize(file_name)
-        if size < 4:
-            logger.error(f"File too small: {file_name} ({size} bytes)")
-            raise ValueError(f"File too small to detect format: {file_name}")
-        self.file_name = file_name
-        self.var = var
-        self.use_memmap = use_memmap
-        self._init_dtypes()
-        self.udef = -1.0e15
-        self.rtiny = 10 * np.finfo(float).tiny
-        fmt = self._detect_format_file(file_name)
-        if fmt=='conv':
-            self._data_type=1
-            self._data_frame=self._readConv()
-        else:
-            self._data_type=2
-            self._data_frame=self._readRad()
+        stream = hasattr(file_name, 'read')
+        name = getattr(file_name, 'name', '<stream>') if stream else file_name
+        logger.info(f"Initializing diagAccess: file={name}, var={var}, use_memmap={use_memmap}")
+        if use_arrow:
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError as exc:
+                raise ImportError("use_arrow=True requires pyarrow (pip install readDiag[arrow])") from exc
+        # file-like objects are read from their start and left open for the caller
+        with (contextlib.nullcontext(file_name) if stream else open(file_name, 'rb')) as f:
+            if stream:
+                f.seek(0)
+            if _has_fileno(f):
+                size = os.fstat(f.fileno()).st_size
+            else:
+                size = f.seek(0, os.SEEK_END)
+                f.seek(0)
+            if size < 4:
+                logger.error(f"File too small: {name} ({size} bytes)")
+                raise ValueError(f"File too small to detect format: {name}")
+            _advise_sequential(f, size)
+            self.file_name = name
+            self._file_size = size
+            self.var = var
+            self.use_memmap = use_memmap
+            self.use_arrow = use_arrow
+            self._init_dtypes()
+            self.udef = -1.0e15
+            self.rtiny = 10 * np.finfo(float).tiny
+            # DataFrames are built on first access and memoized in _frames
+            self._frames: Dict[Any, Any] = {}
+            fmt = self._detect_format_file(f)
+            if fmt=='conv':
+                self._data_type=1
+                self._raw=self._readConv(f)
+            else:
+                self._data_type=2
+                self._raw=self._readRad(f)
 
             
     def get_date(self) -> datetime:
@@ -224,95 +357,257 @@ class diagAccess:
         """
         Get the main data structure containing the diagnostic observations.
 
+        The structure is built from the raw arrays on the first call and the
+        same object is returned afterwards.
+
         Returns:
             Any: Dictionary of DataFrames (conventional) or structured dict (radiance).
         """
-        return self._data_frame  # type: ignore
+        data = self._frames.get('all')
+        if data is None:
+            if self._data_type == 1:
+                data = {
+                    var: {kx: self._conv_frame(var, kx) for kx in by_kx}
+                    for var, by_kx in self._raw.items()
+                }
+            else:
+                nchanl = self._raw['header']['nchanl']
+                data = {
+                    'sensor': self._raw['sensor'],
+                    'kx': self._raw['kx'],
+                    'dataframes': {
+                        'channel_df': self._finish_frame(self._raw['channel_df']),
+                        'diagbuf_df': self._rad_frame('diagbuf'),
+                        'diagbufchan_df': [self._rad_frame('diagbufchan', i) for i in range(nchanl)],
+                        'diagbufex_df': self._rad_frame('diagbufex')
+                    }
+                }
+            self._frames['all'] = data
+        return data
+
+    # kept for code that reaches into the materialized structure directly
+    _data_frame = property(get_data_frame)
+
+    def _conv_frame(self, var: str, kx: int) -> pd.DataFrame:
+        """
+        Return the memoized DataFrame of one (var, kx) conventional group.
 
-    # --- Conventional ---
-    def _get_base_columns(self) -> List[str]:
+        Args:
+            var (str): Observation variable.
+            kx (int): Data source index.
+
+        Returns:
+            pd.DataFrame: Zero-copy frame over the raw array of the group.
+        """
+        if 'all' in self._frames:
+            return self._frames['all'][var][kx]
+        key = ('conv', var, kx)
+        df = self._frames.get(key)
+        if df is None:
+            # one 2-D float32 block over the raw array: zero-copy, and cheaper
+            # to build and filter than a dict of per-column blocks
+            arr = self._raw[var][kx]
+            df = self._finish_frame(pd.DataFrame(
+                arr, index=pd.RangeIndex(len(arr)), columns=self._columns[var], copy=False
+            ))
+            self._frames[key] = df
+        return df
+
+    def _rad_frame(self, name: str, chan: Optional[int] = None) -> pd.DataFrame:
+        """
+        Return a memoized radiance DataFrame.
+
+        Args:
+            name (str): One of 'diagbuf', 'diagbufchan' or 'diagbufex'.
+            chan (Optional[int], optional): Channel index, for 'diagbufchan'.
+
+        Returns:
+            pd.DataFrame: Zero-copy frame over the diagnostic buffer.
+        """
+        if 'all' in self._frames:
+            frames = self._frames['all']['dataframes']
+            return frames['diagbufchan_df'][chan] if chan is not None else frames[f'{name}_df']
+        key = (name, chan)
+        df = self._frames.get(key)
+        if df is None:
+            df = self._finish_frame(
+                self._extract_dataframe(self._raw, name, chan)
+            )
+            self._frames[key] = df
+        return df
+
+    def _finish_frame(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Get the base column names common to conventional diagnostics.
+        Apply the requested DataFrame backend to a freshly built frame.
+
+        Args:
+            df (pd.DataFrame): NumPy-backed frame.
 
         Returns:
-            List[str]: List of column names.
+            pd.DataFrame: `df` itself, or its pyarrow-backed conversion when
+            ``use_arrow`` is set. Each NumPy column keeps its type (float32
+            stays float32, int32 stays int32); categoricals are left as is.
         """
-        return [
-            'kx','lat','lon','elev','prs','dhgt','time','pbqc','emark',
-            'iusev','iuse','wpbqc','inp_err','adj_err','end_err','obs'
-        ]
+        if not self.use_arrow:
+            return df
+        import pyarrow as pa
+        return df.astype({
+            c: pd.ArrowDtype(pa.from_numpy_dtype(dt))
+            for c, dt in df.dtypes.items() if isinstance(dt, np.dtype)
+        })
 
-    def _get_columns(self, var: str, ninfo: int) -> List[str]:
+    # --- Conventional ---
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _get_columns(var: str, ninfo: int) -> Tuple[str, ...]:
         """
         Construct column names for a given variable and number of fields.
 
+        Results are memoized per (var, ninfo).
+
         Args:
             var (str): Variable identifier (e.g., 't', 'q', 'uv', 'ps', etc).
             ninfo (int): Number of diagnostic fields per observation.
 
         Returns:
-            List[str]: Column names to assign to the DataFrame.
-        """
-        base: List[str] = self._get_base_columns()
-        map_cols: Dict[str, List[str]] = {
-            'q': ['omf','omf_wob','qsges'],
-            't': ['omf','omf_wob'],
-            'sst': ['omf'],
-            'uv': ['obs_u','omf_u','omf_wob_u','obs_v','omf_v','omf_wob_v','factw'],
-            'ps': ['omf','omf_wob'],
-            'gps': ['inc_ba','imp_height','zsges','trefges','hob','gps_ref','qrefges']
-        }
-        if var == 'sst' and ninfo >= 21:
-            map_cols['sst'] = ['tref','dtw','dtc','tz']
-        if var == 't' and ninfo >= 20:
-            map_cols['t'] = ['pof','wvv']
+            Tuple[str, ...]: Column names to assign to the DataFrame.
+        """
         if var == 'gps':
-            return [
-                'kx','lat','lon','inc_ba','prs','imp_height','time','zsges',
-                'pbqc','iusev','iuse','wpbqc','inp_err','adj_err','end_err',
-                'obs','trefges','hob','gps_ref','qrefges'
-            ]
-        spec: List[str] = map_cols.get(var, [])
-        return base[:-1] + spec if var == 'uv' else base + spec
+            return _GPS_COLUMNS
+        if var == 'sst' and ninfo >= 21:
+            spec = _SST_EXTRA_COLUMNS
+        elif var == 't' and ninfo >= 20:
+            spec = _T_AIRCRAFT_COLUMNS
+        else:
+            spec = _CONV_SPEC_COLUMNS.get(var, ())
+        return _CONV_BASE_COLUMNS[:-1] + spec if var == 'uv' else _CONV_BASE_COLUMNS + spec
 
     @log_time
-    def _readConv(self) -> Dict[str, Dict[int, pd.DataFrame]]:
+    def _readConv(self, f: IO[bytes]) -> Dict[str, Dict[int, np.ndarray]]:
         """
         Read conventional diagnostic data from binary file.
 
+        Args:
+            f (IO[bytes]): Open file object, positioned at the start.
+
         Returns:
-            Dict[str, Dict[int, pd.DataFrame]]: Nested dictionary by variable and channel.
+            Dict[str, Dict[int, np.ndarray]]: Raw (nobs, ninfo - 1) arrays by variable and kx.
+            Column names are stored per variable in ``self._columns``.
 
         Raises:
             ValueError: If the file header is invalid.
         """
         logger.info(f"Reading conventional diagnostics from {self.file_name}")
         # Protect against incomplete conventional file headers
-        with open(self.file_name, 'rb') as f:
-            try:
-                hdr_vals = np.fromfile(f, '>i4', 3)
-                if hdr_vals.size < 3:
-                    raise IndexError
-                _, idate, _ = hdr_vals
-            except Exception:
-                logger.error(f"Invalid conventional header in {self.file_name}", exc_info=True)
-                raise ValueError(f"Invalid conventional header: {self.file_name}")
-            self._idate = datetime.strptime(str(int(idate)), '%Y%m%d%H')
-            result: Dict[str, Dict[int, pd.DataFrame]] = {}
-
-            # Continue reading blocks
-            while True:
-                hv = self._read_conv_header(f)
-                if hv is None:
-                    break
-                nobs, ninfo, var = hv
-                if nobs > 0:
-                    data = self._read_conv_diag_data(f, nobs, ninfo)
-                    if not self.var or self.var == var:
-                        self._process_conv_data(data, var, nobs, ninfo, result)
-                else:
-                    f.read(4)
-        return result
+        try:
+            _, idate, _ = self._CONV_FILE_HDR.unpack(f.read(self._CONV_FILE_HDR.size))
+        except Exception:
+            logger.error(f"Invalid conventional header in {self.file_name}", exc_info=True)
+            raise ValueError(f"Invalid conventional header: {self.file_name}")
+        self._idate = datetime.strptime(str(int(idate)), '%Y%m%d%H')
+        chunks: Dict[str, Dict[int, List[np.ndarray]]] = {}
+        columns: Dict[str, List[str]] = {}
+
+        # Continue reading blocks
+        # the per-block reader relies on np.fromfile, i.e. a real file descriptor
+        mapped = self.use_memmap is not False or not _has_fileno(f)
+        blocks = self._iter_conv_blocks_mmap(f) if mapped else self._iter_conv_blocks(f)
+        for nobs, ninfo, var, data in blocks:
+            if not self.var or self.var == var:
+                if var not in columns:
+                    columns[var] = list(self._get_columns(var, ninfo))
+                self._process_conv_data(data, var, nobs, ninfo, chunks)
+        self._columns = columns
+        # A kx may span several blocks: join its raw pieces once, at the end
+        return {
+            var: {
+                k: parts[0] if len(parts) == 1 else np.concatenate(parts, axis=0)
+                for k, parts in by_kx.items()
+            }
+            for var, by_kx in chunks.items()
+        }
+
+    def _iter_conv_blocks(self, f: IO[bytes]) -> Iterator[Tuple[int, int, str, Any]]:
+        """
+        Yield the non-empty data blocks of a conventional file read with np.fromfile.
+
+        Args:
+            f (IO[bytes]): Open file object, positioned after the file header.
+
+        Yields:
+            Tuple[int, int, str, Any]: nobs, ninfo, variable name and raw block.
+        """
+        while True:
+            hv = self._read_conv_header(f)
+            if hv is None:
+                return
+            nobs, ninfo, var = hv
+            if nobs > 0:
+                yield nobs, ninfo, var, self._read_conv_diag_data(f, nobs, ninfo)
+            else:
+                f.read(4)
+
+    def _iter_conv_blocks_mmap(self, f: IO[bytes]) -> Iterator[Tuple[int, int, str, Any]]:
+        """
+        Yield the non-empty data blocks of a conventional file from a memory map.
+
+        File-like objects without a file descriptor are read into memory once
+        and walked the same way.
+
+        Block headers are unpacked in place (by a compiled scanner when Numba
+        is installed) and data blocks are taken with np.frombuffer at tracked
+        offsets, so each block is a big-endian view into the map; the only copy
+        happens when rows are regrouped by kx in `_process_conv_data`.
+
+        Args:
+            f (IO[bytes]): Open file object, positioned after the file header.
+
+        Yields:
+            Tuple[int, int, str, Any]: nobs, ninfo, variable name and raw block.
+        """
+        pos = f.tell()  # np.memmap moves the handle to EOF
+        mm = _map_sequential(f) if _has_fileno(f) else _read_whole(f, self._file_size)
+        kernels = get_kernels()
+        if kernels is not None:
+            # compiled scan of all block headers; Python only wraps the payloads
+            for nobs, ninfo, data_pos, var_pos in kernels.scan_conv_blocks(np.asarray(mm), pos).tolist():
+                dt = self._conv_data_dtype(nobs, ninfo)
+                var = bytes(mm[var_pos:var_pos + 3]).decode().strip()
+                yield nobs, ninfo, var, np.frombuffer(mm, dt, 1, data_pos)[0]
+            return
+        hdr = self._CONV_BLOCK_HDR
+        while pos + hdr.size <= mm.size:
+            _, var, _, ninfo, nobs, _, _, _ = hdr.unpack_from(mm, pos)
+            pos += hdr.size
+            if nobs > 0:
+                dt = self._conv_data_dtype(nobs, ninfo)
+                yield nobs, ninfo, var.decode().strip(), np.frombuffer(mm, dt, 1, pos)[0]
+                pos += dt.itemsize
+            else:
+                pos += 4
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _conv_data_dtype(nobs: int, ninfo: int) -> np.dtype:
+        """
+        Build the record dtype of a conventional data block.
+
+        Memoized per (nobs, ninfo), since block sizes repeat within and across files.
+
+        Args:
+            nobs (int): Number of observations.
+            ninfo (int): Number of fields per observation.
+
+        Returns:
+            np.dtype: Big-endian structured dtype of the block.
+        """
+        return np.dtype([
+            ('eh', '>i4'),
+            ('cb', '>S8', (nobs,)),
+            ('rb', ('>f4', (nobs, ninfo))),
+            ('et', '>i4')
+        ])
+
     def _read_conv_header(self, f: IO[bytes]) -> Optional[Tuple[int, int, str]]:
         """
         Read and decode the header of a conventional diagnostic block.
@@ -323,19 +618,12 @@ class diagAccess:
         Returns:
             Optional[Tuple[int, int, str]]: Number of observations, info count, and variable name.
         """
-        dtype = [
-            ('head', '>i4'), ('var', 'S3'), ('nchar', '>i4'),
-            ('ninfo', '>i4'), ('nobs', '>i4'), ('mype', '>i4'),
-            ('tail', '>i4'), ('tail2', '>i4')
-        ]
-        hdr = np.fromfile(f, dtype, 1)
-        if not hdr.size:
+        hdr = self._CONV_BLOCK_HDR
+        buf = f.read(hdr.size)
+        if len(buf) < hdr.size:
             return None
-        return (
-            int(hdr['nobs'][0]),
-            int(hdr['ninfo'][0]),
-            hdr['var'][0].decode().strip()
-        )
+        _, var, _, ninfo, nobs, _, _, _ = hdr.unpack_from(buf)
+        return nobs, ninfo, var.decode().strip()
 
     def _read_conv_diag_data(
         self,
@@ -354,14 +642,10 @@ class diagAccess:
         Returns:
             Any: Raw binary array of observation values.
         """
-        dt = np.dtype([
-            ('eh', '>i4'),
-            ('cb', ('>S8', nobs)),
-            ('rb', ('>f4', (nobs, ninfo))),
-            ('et', '>i4')
-        ])
-        arr = np.fromfile(f, dt, 1).byteswap().newbyteorder()[0]
-        return arr
+        arr = np.fromfile(f, self._conv_data_dtype(nobs, ninfo), 1)
+        # swap the freshly read buffer in place and only relabel its dtype
+        arr.byteswap(inplace=True)
+        return arr.view(arr.dtype.newbyteorder())[0]
 
     def _process_conv_data(
         self,
@@ -369,165 +653,263 @@ class diagAccess:
         var: str,
         nobs: int,
         ninfo: int,
-        out: Dict[str, Dict[int, pd.DataFrame]]
+        out: Dict[str, Dict[int, List[np.ndarray]]]
     ) -> None:
         """
-        Convert raw data into DataFrame and insert it into the output structure.
+        Split a raw data block by kx and append the raw pieces to the output structure.
+
+        Rows are grouped with a single stable sort on kx (a Numba counting sort
+        when Numba is installed), so each group is a contiguous slice instead
+        of a boolean-mask scan per kx value.
 
         Args:
             data (Any): Raw array of diagnostic data.
             var (str): Observation variable.
             nobs (int): Number of observations.
             ninfo (int): Number of fields per observation.
-            out (Dict[str, Dict[int, pd.DataFrame]]): Output dictionary to populate.
+            out (Dict[str, Dict[int, List[np.ndarray]]]): Output dictionary to populate.
         """
         arr = data['rb'].reshape(nobs, ninfo)
         kx = np.rint(arr[:, 0]).astype(int)
-        for k in np.unique(kx):
-            rows = arr[kx == k, 1:]
-            df = pd.DataFrame(rows, columns=self._get_columns(var, ninfo))
-            out.setdefault(var, {})
-            out[var][k] = (
-                df
-                if k not in out[var]
-                else pd.concat([out[var][k], df], ignore_index=True)
-            )
+        kernels = get_kernels()
+        if kernels is not None:
+            ks, bounds, order = kernels.bin_by_kx(kx)
+            starts, ends = bounds[:-1], bounds[1:]
+        else:
+            order = np.argsort(kx, kind='stable')
+            ks, starts = np.unique(kx[order], return_index=True)
+            ends = np.r_[starts[1:], nobs]
+        arr_s = arr[order]
+        if not arr_s.dtype.isnative:
+            # blocks mapped from disk are big-endian views; swap the regrouped copy
+            arr_s = arr_s.byteswap(inplace=True).view(arr_s.dtype.newbyteorder())
+        by_kx = out.setdefault(var, {})
+        for k, s, e in zip(ks, starts, ends):
+            by_kx.setdefault(k, []).append(arr_s[s:e, 1:])
 
     # --- Radiance ---
     @log_time
-    def _readRad(self) -> Dict[str, Any]:
+    def _readRad(self, f: IO[bytes]) -> Dict[str, Any]:
         """
         Read radiance diagnostic data from binary file.
 
+        Args:
+            f (IO[bytes]): Open file object, positioned at the start.
+
         Returns:
-            Dict[str, Any]: Dictionary with metadata and dataframes.
+            Dict[str, Any]: Sensor, platform, channel table, parsed header, the
+            raw diagnostic buffer, its (nobs, nchanl, total) channel view and the
+            channel column names.
 
         Raises:
             ValueError: If the header is invalid.
         """
-        logger.info(f"Reading radiance diagnostics from {self.file_name} (memmap={self.use_memmap})")
-        f: IO[bytes] = open(self.file_name, 'rb')
+        mapped = self.use_memmap is not False and _has_fileno(f)
+        logger.info(f"Reading radiance diagnostics from {self.file_name} (memmap={mapped})")
+        # One mapping (or one bulk read) of the whole file; the parsers below
+        # only take views of it at increasing offsets
+        buf = _map_sequential(f) if mapped else _read_whole(f, self._file_size)
         # Protege o parse do header
         try:
-            hdr, size = self._read_header(f)
+            hdr, offset = self._read_header(buf, 0)
         except IndexError:
             logger.error(f"Invalid radiance header in {self.file_name}", exc_info=True)
             raise ValueError(f"Invalid radiance header: {self.file_name}")
         # Continua a leitura normalmente
-        chdf = self._read_channel_info(f, hdr['nchanl'])
-        diag = self._read_diagnostic_data(f, size, hdr)
-        df1, df_list, df2 = self._extract_dataframes(diag, hdr)
+        chdf, offset = self._read_channel_info(buf, offset, hdr['nchanl'])
+        diag = self._read_diagnostic_data(buf, offset, hdr)
         idate = hdr['idate']
         self._idate = datetime.strptime(str(idate), "%Y%m%d%H")
-        f.close()
+        total = hdr['ipchan'] + hdr['npred'] + 2
         return {
             'sensor': hdr['obstype'],
             'kx': hdr['dplat'],
-            'dataframes': {
-                'channel_df': chdf,
-                'diagbuf_df': df1,
-                'diagbufchan_df': df_list,
-                'diagbufex_df': df2
-            }
+            'channel_df': chdf,
+            'header': hdr,
+            'diag': diag,
+            # (nobs, nchanl * total) -> (nobs, nchanl, total): a stride change,
+            # no copy; done once so each channel frame is a plain view
+            'dbc': diag['dbc'].reshape(len(diag), hdr['nchanl'], total),
+            'chan_cols': self._chan_columns(hdr['npred'])
         }
 
-    def _read_header(self, f: IO[bytes]) -> Tuple[Dict[str, Any], int]:
+    def _read_header(self, buf: Any, offset: int) -> Tuple[Dict[str, Any], int]:
         """
-        Read and parse the main header of a radiance diagnostic file.
+        Parse the main header of a radiance diagnostic file.
 
         Args:
-            f (IO[bytes]): Open file object.
+            buf (Any): Buffer holding the file contents.
+            offset (int): Byte offset of the header.
 
         Returns:
-            Tuple[Dict[str, Any], int]: Parsed header and file size.
+            Tuple[Dict[str, Any], int]: Parsed header and the offset just past it.
+
+        Raises:
+            IndexError: If the buffer is too short to hold a header.
         """
-        rec = np.fromfile(f, type(self).header_info_dtype, 1)[0]
+        cls = type(self)
+        dt = cls.header_info_dtype
+        if len(buf) - offset < dt.itemsize:
+            raise IndexError("truncated radiance header")
+        rec = np.frombuffer(buf, dt, 1, offset).astype(cls.native_header_info_dtype)[0]
         hdr = {k: rec[k] for k in rec.dtype.names}
-        size = os.path.getsize(self.file_name)
-        return hdr, size
+        return hdr, offset + dt.itemsize
 
     def _read_channel_info(
         self,
-        f: IO[bytes],
+        buf: Any,
+        offset: int,
         nchanl: int
-    ) -> pd.DataFrame:
+    ) -> Tuple[pd.DataFrame, int]:
         """
-        Read information for each radiance channel.
+        Parse information for each radiance channel.
 
         Args:
-            f (IO[bytes]): Open file object.
+            buf (Any): Buffer holding the file contents.
+            offset (int): Byte offset of the first channel record.
             nchanl (int): Number of channels in the file.
 
         Returns:
-            pd.DataFrame: DataFrame containing channel-level metadata.
+            Tuple[pd.DataFrame, int]: DataFrame containing channel-level metadata
+            and the offset just past the channel records.
         """
-        arr = np.fromfile(f, type(self).channel_info_dtype, nchanl)
-        arr = arr.byteswap().newbyteorder()
-        return pd.DataFrame(arr).drop(['head', 'tail'], axis=1)
+        dt = type(self).channel_info_dtype
+        nchanl = min(int(nchanl), (len(buf) - offset) // dt.itemsize)
+        arr = np.frombuffer(buf, dt, nchanl, offset)
+        # cast only the kept fields, each straight into a native column
+        df = pd.DataFrame(
+            {k: _to_native(arr[k]) for k in dt.names if k not in ('head', 'tail')}, copy=False
+        )
+        return df, offset + nchanl * dt.itemsize
 
     def _read_diagnostic_data(
         self,
-        f: IO[bytes],
-        file_size: int,
+        buf: Any,
+        offset: int,
         header: Dict[str, Any]
     ) -> np.ndarray:
         """
-        Read diagnostic data buffer from radiance file.
+        Parse the diagnostic data records of a radiance file.
 
         Args:
-            f (IO[bytes]): Open file object.
-            file_size (int): Total file size in bytes.
+            buf (Any): Buffer holding the file contents (writable bytes, or a
+                read-only memmap).
+            offset (int): Byte offset of the first data record.
             header (Dict[str, Any]): Parsed header values.
 
         Returns:
-            np.ndarray: Structured array containing diagnostic data.
-        """
-        dt = np.dtype([
-            ('eh', np.void, 4),
-            ('db', ('>f4', header['ireal'])),
-            ('dbc', ('>f4', (header['ipchan'] + header['npred'] + 2) * header['nchanl'])),
-            ('dbe', ('>f4', header['jextra'])) if header['iextra'] > 0 else ('>f4', 0),
-            ('et', np.void, 4)
-        ])
-        num = (file_size - 4) // dt.itemsize
-        if self.use_memmap:
-            offset = f.tell()
-            mm = np.memmap(self.file_name, dtype=dt, mode='r', offset=offset, shape=(num,))
-            f.seek(offset + num * dt.itemsize)
-            return mm.byteswap().newbyteorder()
-        buf = f.read(num * dt.itemsize)
-        return np.frombuffer(buf, dtype=dt).byteswap().newbyteorder()
-
-    def _extract_dataframes(
+            np.ndarray: Structured array containing diagnostic data, native-endian,
+            or a big-endian view of the buffer when it is a read-only memmap.
+        """
+        dt = self._diag_record_dtype(
+            int(header['ireal']),
+            int((header['ipchan'] + header['npred'] + 2) * header['nchanl']),
+            int(header['jextra']) if header['iextra'] > 0 else 0
+        )
+        num = (len(buf) - offset) // dt.itemsize
+        arr = np.frombuffer(buf, dt, num, offset)
+        if isinstance(buf, np.memmap):
+            # keep the read-only mapping as backing store; _extract_dataframe
+            # swaps each column only when its frame is materialized
+            return arr
+        dt_native = dt.newbyteorder('=')
+        if dt_native == dt:
+            return arr
+        # the bulk-read buffer is private to this reader: swap it in place
+        arr.byteswap(inplace=True)
+        return arr.view(dt_native)
+
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def _chan_columns(cls, npred: int) -> Tuple[str, ...]:
+        """
+        Column names of the per-channel radiance frames, memoized per npred.
+
+        Args:
+            npred (int): Number of bias-correction predictors.
+
+        Returns:
+            Tuple[str, ...]: Channel fields followed by pred1 .. pred{npred + 2}.
+        """
+        return tuple(cls.header_diagbufchan) + tuple(f'pred{i}' for i in range(1, npred + 3))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _diag_record_dtype(ireal: int, nchan_words: int, jextra: int) -> np.dtype:
+        """
+        Build the packed big-endian dtype of one radiance data record.
+
+        The record is ``eh, db[ireal], dbc[nchan_words], dbe[jextra], et`` with
+        explicit offsets and no padding; ``dbe`` is left out when there is no
+        extra block. Memoized per header shape.
+
+        Args:
+            ireal (int): Number of observation-level values.
+            nchan_words (int): Number of channel-level values, all channels.
+            jextra (int): Number of extra values (0 if none).
+
+        Returns:
+            np.dtype: Structured record dtype.
+        """
+        fields = [('eh', 'V4'), ('db', ('>f4', (ireal,))), ('dbc', ('>f4', (nchan_words,)))]
+        if jextra > 0:
+            fields.append(('dbe', ('>f4', (jextra,))))
+        fields.append(('et', 'V4'))
+        offsets = []
+        size = 0
+        for _, fmt in fields:
+            offsets.append(size)
+            size += np.dtype(fmt).itemsize
+        return np.dtype({
+            'names': [name for name, _ in fields],
+            'formats': [fmt for _, fmt in fields],
+            'offsets': offsets,
+            'itemsize': size
+        }, align=False)
+
+    def _extract_dataframe(
         self,
-        diag: np.ndarray,
-        header: Dict[str, Any]
-    ) -> Tuple[pd.DataFrame, List[pd.DataFrame], pd.DataFrame]:
+        raw: Dict[str, Any],
+        name: str,
+        chan: Optional[int] = None
+    ) -> pd.DataFrame:
         """
-        Extract DataFrames from radiance diagnostic array.
+        Extract one DataFrame from the radiance diagnostic array.
 
         Args:
-            diag (np.ndarray): Structured array of diagnostic data.
-            header (Dict[str, Any]): Header with dimension sizes.
+            raw (Dict[str, Any]): Radiance storage built by `_readRad`.
+            name (str): 'diagbuf' (main data), 'diagbufchan' (one channel) or
+                'diagbufex' (extra info).
+            chan (Optional[int], optional): Channel index, for 'diagbufchan'.
 
         Returns:
-            Tuple[pd.DataFrame, List[pd.DataFrame], pd.DataFrame]: Main data, per-channel data, and extra info.
+            pd.DataFrame: The requested frame.
         """
-        df1 = pd.DataFrame(
-            diag['db'][:, :len(self.header_diagbuf)], columns=self.header_diagbuf
-        )
-        chan_list: List[pd.DataFrame] = []
-        total = header['ipchan'] + header['npred'] + 2
-        cols = self.header_diagbufchan.copy()
-        for i in range(1, header['npred'] + 3):
-            cols.append(f'pred{i}')
-        for i in range(header['nchanl']):
-            s, e = i * total, (i + 1) * total
-            chan_list.append(
-                pd.DataFrame(diag['dbc'][:, s:e], columns=cols)
+        # Build frames from dicts of 1-D column views (copy=False) so pandas
+        # adopts the native float32 buffers instead of copying a 2-D block.
+        # Memory-mapped buffers are still big-endian: only the columns of the
+        # requested frame are swapped into native copies.
+        diag = raw['diag']
+        index = pd.RangeIndex(len(diag))
+        if name == 'diagbuf':
+            db = diag['db'][:, :len(self.header_diagbuf)]
+            if not db.dtype.isnative:
+                # one fused swap + copy of just the used columns, column-major
+                # so each column comes out contiguous
+                db = db.astype(db.dtype.newbyteorder('='), order='F')
+            return pd.DataFrame(
+                {c: db[:, i] for i, c in enumerate(self.header_diagbuf)},
+                index=index, copy=False
             )
-        df2 = pd.DataFrame(diag['dbe'])
-        return df1, chan_list, df2
+        if name == 'diagbufex':
+            if 'dbe' not in diag.dtype.names:
+                return pd.DataFrame(index=index)
+            return pd.DataFrame(_to_native(diag['dbe']), index=index)
+        dbc = raw['dbc']
+        return pd.DataFrame(
+            {c: _to_native(dbc[:, chan, j]) for j, c in enumerate(raw['chan_cols'])},
+            index=index, copy=False
+        )
 
     @classmethod
     @log_time
@@ -535,45 +917,99 @@ class diagAccess:
         cls,
         file_list: List[str],
         var: Optional[str] = None,
-        n_workers: int = 4
+        n_workers: int = 4,
+        use_threads: bool = False,
+        use_arrow: bool = False
     ) -> Union[pd.DataFrame, List[Any]]:
         """
         Read and concatenate diagnostics from multiple files in parallel.
 
+        Files are parsed in separate processes, since decoding is CPU-bound
+        Python work that threads would serialize on the GIL. Use
+        `iter_time_series` to process files one at a time instead of holding
+        all of them in memory.
+
         Args:
             file_list (List[str]): List of file paths.
             var (Optional[str], optional): Variable to extract. Defaults to None.
             n_workers (int, optional): Number of parallel workers. Defaults to 4.
+            use_threads (bool, optional): Use threads instead of processes, e.g. when
+                reading is I/O-bound on a network filesystem. Defaults to False.
+            use_arrow (bool, optional): Return pyarrow-backed DataFrames, as in
+                `diagAccess`. Defaults to False.
 
         Returns:
-            Union[pd.DataFrame, List[Any]]: Concatenated DataFrame or list of outputs.
+            Union[pd.DataFrame, List[Any]]: Concatenated DataFrame, with a
+            categorical 'channel' (kx) and a datetime64[s] 'date' column, or
+            list of outputs.
 
         Example:
             >>> files = ["diag_conv_ges.2023010100", "diag_conv_ges.2023010112"]
             >>> df_uv = diagAccess.read_time_series(files, var="uv")
         """
-        """
-        Read multiple diagnostic files in parallel and concatenate results for a given variable.
-        """
-        def _load(path: str) -> Union[pd.DataFrame, Any]:
-            rd = cls(path, var)
-            if rd.get_data_type() == 1:
-                data = rd.get_data_frame().get(var, {})
-                dfs: List[pd.DataFrame] = []
-                for ch, df in data.items():
-                    tmp = df.copy()
-                    tmp['channel'] = ch
-                    tmp['date'] = rd.get_date()
-                    dfs.append(tmp)
-                return pd.concat(dfs, ignore_index=True) if dfs else pd.DataFrame()
-            return rd.get_data_frame()
-
-        with ThreadPoolExecutor(max_workers=n_workers) as exe:
-            results = list(exe.map(_load, file_list))
+        executor = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+        max_workers = max(1, min(n_workers, len(file_list)))
+        # hand files to worker processes in batches to cut IPC round trips on
+        # long lists (ignored by the thread pool)
+        chunksize = max(1, len(file_list) // (4 * max_workers))
+        with executor(max_workers=max_workers) as exe:
+            results = list(exe.map(_load_series, [cls] * len(file_list), file_list,
+                                   [var] * len(file_list), [use_arrow] * len(file_list),
+                                   chunksize=chunksize))
         if results and isinstance(results[0], pd.DataFrame):
-            return pd.concat(results, ignore_index=True)
+            return _concat_frames(results)
         return results
 
+    @classmethod
+    def iter_time_series(
+        cls,
+        file_list: List[str],
+        var: Optional[str] = None,
+        n_workers: int = 4,
+        use_threads: bool = False,
+        use_arrow: bool = False
+    ) -> Iterator[Union[pd.DataFrame, Any]]:
+        """
+        Read diagnostics from multiple files in parallel, yielding them in order.
+
+        Unlike `read_time_series`, results are handed over one file at a time
+        and at most ``2 * n_workers`` files are read ahead, so callers that
+        reduce or write out each file keep peak memory bounded by the window
+        rather than by the length of `file_list`.
+
+        Args:
+            file_list (List[str]): List of file paths.
+            var (Optional[str], optional): Variable to extract. Defaults to None.
+            n_workers (int, optional): Number of parallel workers. Defaults to 4.
+            use_threads (bool, optional): Use threads instead of processes. Defaults to False.
+            use_arrow (bool, optional): Return pyarrow-backed DataFrames. Defaults to False.
+
+        Yields:
+            Union[pd.DataFrame, Any]: Per-file output of `read_time_series`, in
+            the order of `file_list`.
+
+        Example:
+            >>> for df in diagAccess.iter_time_series(files, var="t"):
+            ...     means.append(df["omf"].mean())
+        """
+        executor = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+        max_workers = max(1, min(n_workers, len(file_list)))
+        files = iter(file_list)
+        with executor(max_workers=max_workers) as exe:
+            pending: deque[Future] = deque(
+                exe.submit(_load_series, cls, path, var, use_arrow)
+                for path in itertools.islice(files, 2 * max_workers)
+            )
+            try:
+                while pending:
+                    result = pending.popleft().result()
+                    for path in itertools.islice(files, 1):
+                        pending.append(exe.submit(_load_series, cls, path, var, use_arrow))
+                    yield result
+            finally:
+                for fut in pending:
+                    fut.cancel()
+
 # --- Utils ---
     def get_variables(self) -> List[str]:
         """
@@ -591,7 +1027,7 @@ class diagAccess:
         """
         if self._data_type != 1:
             raise ValueError("get_variables is only available for conventional data.")
-        return list(self._data_frame.keys())
+        return list(self._raw.keys())
 
     def get_kx_list(self, var: str) -> List[int]:
         """
@@ -614,9 +1050,9 @@ class diagAccess:
         """
         if self._data_type != 1:
             raise ValueError("get_kx_list is only available for conventional data.")
-        if var not in self._data_frame:
+        if var not in self._raw:
             raise ValueError(f"Variable '{var}' not found.")
-        return sorted(self._data_frame[var].keys())
+        return sorted(self._raw[var].keys())
 
     def get_channels(self) -> List[int]:
         """
@@ -634,8 +1070,7 @@ class diagAccess:
         """
         if self._data_type != 2:
             raise ValueError("get_channels is only available for radiance data.")
-        df_list = self._data_frame["dataframes"]["diagbufchan_df"]
-        return list(range(len(df_list)))
+        return list(range(int(self._raw["header"]["nchanl"])))
 
     def get_metadata(self) -> Dict[str, Any]:
         """
@@ -662,8 +1097,8 @@ class diagAccess:
             "date": self.get_date()
         }
         if self._data_type == 2:
-            meta["sensor"] = self._data_frame.get("sensor")
-            meta["kx"] = self._data_frame.get("kx")
+            meta["sensor"] = self._raw.get("sensor")
+            meta["kx"] = self._raw.get("kx")
         return meta
 
     def get_dataframe(self, var: str, kx: int) -> pd.DataFrame:
@@ -689,7 +1124,7 @@ class diagAccess:
         """
         if self._data_type != 1:
             raise ValueError("get_dataframe only valid for conventional diagnostics.")
-        return self._data_frame[var][kx]
+        return self._conv_frame(var, kx)
 
 
 
@@ -713,9 +1148,9 @@ class diagAccess:
                 kx_list = self.get_kx_list(v)
                 lines.append(f"  {v}: {len(kx_list)} kx types")
         elif self._data_type == 2:
-            lines.append(f"Sensor: {self._data_frame.get('sensor')}")
-            lines.append(f"Platform: {self._data_frame.get('kx')}")
-            ch = self._data_frame["dataframes"]["channel_df"]
+            lines.append(f"Sensor: {self._raw.get('sensor')}")
+            lines.append(f"Platform: {self._raw.get('kx')}")
+            ch = self._raw["channel_df"]
             lines.append(f"Channels: {ch.shape[0]}")
         return "\n".join(lines)
 
@@ -735,10 +1170,10 @@ class diagAccess:
         }
         if self._data_type == 2:
             info.update({
-                "sensor": self._data_frame.get("sensor"),
-                "platform": self._data_frame.get("kx"),
-                "n_channels": self._data_frame["dataframes"]["channel_df"].shape[0],
-                "n_obs": self._data_frame["dataframes"]["diagbuf_df"].shape[0]
+                "sensor": self._raw.get("sensor"),
+                "platform": self._raw.get("kx"),
+                "n_channels": self._raw["channel_df"].shape[0],
+                "n_obs": len(self._raw["diag"])
             })
         return info
 
@@ -765,7 +1200,7 @@ class diagAccess:
         else:
             if channel is None:
                 raise ValueError("For radiance files, channel index must be provided.")
-            df = self._data_frame["dataframes"]["diagbufchan_df"][channel]
+            df = self._rad_frame('diagbufchan', channel)
         df.to_csv(path, index=False)
 
     def get_kx_counts(self, var: str) -> Dict[int, int]:
@@ -789,10 +1224,10 @@ class diagAccess:
         """
         if self._data_type != 1:
             raise ValueError("get_kx_counts is only available for conventional data.")
-        if var not in self._data_frame:
+        if var not in self._raw:
             raise ValueError(f"Variable '{var}' not found.")
         
-        return {kx: len(df) for kx, df in self._data_frame[var].items()}
+        return {kx: len(arr) for kx, arr in self._raw[var].items()}
     
     
     
@@ -816,3 +1251,91 @@ class diagAccess:
     # backward compatibility alias
 DiagAccess = diagAccess
 
+
+def _load_series(
+    cls: type,
+    path: str,
+    var: Optional[str],
+    use_arrow: bool = False
+) -> Union[pd.DataFrame, Any]:
+    """
+    Load one file for `diagAccess.read_time_series`.
+
+    Defined at module level so it can be pickled into worker processes.
+
+    Args:
+        cls (type): diagAccess class (or subclass) used to read the file.
+        path (str): Path to the diagnostic file.
+        var (Optional[str]): Variable to extract.
+        use_arrow (bool): Return a pyarrow-backed DataFrame.
+
+    Returns:
+        Union[pd.DataFrame, Any]: Conventional data for `var` with a categorical
+        'channel' (kx) and a datetime64[s] 'date' column, or the radiance data
+        structure.
+    """
+    rd = cls(path, var, use_arrow=use_arrow)
+    if rd.get_data_type() != 1:
+        return rd.get_data_frame()
+    blocks = rd._raw.get(var, {})
+    nrows = [len(a) for a in blocks.values()]
+    if not sum(nrows):
+        return pd.DataFrame()
+    # stack the raw (var, kx) arrays in one copy and wrap them once: no per-kx
+    # DataFrame is built; rows are labelled with their kx in one vectorized step
+    values = np.concatenate(list(blocks.values()), axis=0)
+    cols = {c: values[:, i] for i, c in enumerate(rd._columns[var])}
+    # kx repeats over every row of a group: store it as small category codes
+    kxs, codes = np.unique(np.fromiter(blocks.keys(), dtype=np.int64, count=len(blocks)),
+                           return_inverse=True)
+    cols['channel'] = pd.Categorical.from_codes(np.repeat(codes, nrows), categories=kxs)
+    # the constant date goes in with the other columns: no block insert afterwards
+    cols['date'] = np.full(len(values), np.datetime64(rd.get_date(), 's'))
+    return rd._finish_frame(pd.DataFrame(cols, index=pd.RangeIndex(len(values)), copy=False))
+
+
+def _concat_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Stack DataFrames row-wise into one frame with a fresh RangeIndex.
+
+    Empty frames are skipped, so they cannot upcast the result dtypes. When
+    all remaining frames share columns and dtypes, each NumPy output column
+    is preallocated once and filled slice by slice, avoiding the intermediate
+    block copies of `pd.concat`, and categorical columns are merged with
+    `union_categoricals` so differing categories don't degrade them to
+    object; otherwise `pd.concat` is used.
+
+    Args:
+        frames (List[pd.DataFrame]): Frames to stack.
+
+    Returns:
+        pd.DataFrame: The stacked frame (empty if there is nothing to stack).
+    """
+    frames = [df for df in frames if len(df)]
+    if not frames:
+        return pd.DataFrame()
+    first = frames[0]
+    if not (
+        first.columns.is_unique
+        and all(df.columns.equals(first.columns) for df in frames[1:])
+    ):
+        return pd.concat(frames, ignore_index=True, copy=False)
+    total = sum(len(df) for df in frames)
+    out: Dict[Any, Any] = {}
+    for c, dt in first.dtypes.items():
+        parts = [df[c] for df in frames]
+        if isinstance(dt, pd.CategoricalDtype) and all(
+            isinstance(p.dtype, pd.CategoricalDtype) for p in parts
+        ):
+            out[c] = union_categoricals(parts, sort_categories=True)
+        elif isinstance(dt, np.dtype) and all(p.dtype == dt for p in parts):
+            col = np.empty(total, dtype=dt)
+            start = 0
+            for p in parts:
+                col[start:start + len(p)] = p.to_numpy()
+                start += len(p)
+            out[c] = col
+        else:
+            return pd.concat(frames, ignore_index=True, copy=False)
+    return pd.DataFrame(out, index=pd.RangeIndex(total), copy=False)
+
@@ -0,0 +1,98 @@
+import os
+import struct
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+# backend não-interativo, definido uma vez para toda a suíte; via ambiente
+# também vale para os processos filhos (ex.: read_time_series)
+os.environ.setdefault("MPLBACKEND", "Agg")
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+# caminhos do projeto, calculados uma vez para todos os módulos de teste
+ROOT = Path(__file__).resolve().parent.parent
+DATA = ROOT / "data"
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from readDiag import diagAccess
+
+# Agg mais rápido: simplifica caminhos densos e os desenha em blocos
+matplotlib.rcParams["path.simplify_threshold"] = 1.0
+matplotlib.rcParams["agg.path.chunksize"] = 10000
+
+
+def pytest_addoption(parser):
+    parser.addoption("--runslow", action="store_true", default=False,
+                     help="roda também os testes marcados como slow")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="precisa de --runslow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@lru_cache(maxsize=None)
+def _load_diag(path):
+    # mapeado: as páginas vêm do page cache, compartilhadas entre os testes
+    return diagAccess(path, use_memmap=True)
+
+
+def load_diag(path):
+    """Retorna o diagAccess de `path`, lido uma única vez por processo.
+
+    O DataFrame de `get_data_frame()` já é memoizado pelo próprio objeto, então
+    leituras repetidas (parametrizações, filtros com -k) não tocam o disco.
+    Os objetos são compartilhados entre os testes: trate-os como somente
+    leitura.
+    """
+    return _load_diag(os.path.abspath(path))
+
+
+def write_conv_file(path, blocks, idate=2020010100):
+    """Grava um diag convencional mínimo (big-endian) a partir de blocos (var, rows)."""
+    with open(path, "wb") as f:
+        f.write(struct.pack(">3i", 4, idate, 4))
+        for var, rows in blocks:
+            rows = np.asarray(rows, dtype=">f4")
+            nobs, ninfo = rows.shape
+            f.write(struct.pack(">i3s6i", 0, var.encode().ljust(3), 0, ninfo, nobs, 0, 0, 0))
+            f.write(struct.pack(">i", 0) + b" " * 8 * nobs + rows.tobytes() + struct.pack(">i", 0))
+
+
+@pytest.fixture(scope="session")
+def read_diag():
+    """Carregador compartilhado de arquivos diag (ver `load_diag`)."""
+    return load_diag
+
+
+@pytest.fixture(scope="session")
+def diag_file(request):
+    """diagAccess em cache do arquivo de DATA dado via indirect=True."""
+    return load_diag(DATA / request.param)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_mpl():
+    """Carrega o cache de fontes e o Agg uma vez, antes do primeiro teste."""
+    import matplotlib.font_manager as fm
+    fm.findfont("DejaVu Sans")
+    fig = plt.figure()
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+@pytest.fixture(autouse=True)
+def _mpl_cleanup():
+    """Fecha as figuras de cada teste, mantendo a memória da suíte constante."""
+    plt.ioff()
+    yield
+    plt.close("all")
@@ -1,12 +1,7 @@
-import os
-import sys
 import importlib.util
-from pathlib import Path
 import pytest
 
-# Ensure project root in sys.path
-ROOT = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(ROOT))
+from conftest import DATA, ROOT
 
 # Import refactored and legacy classes
 from readDiag import diagAccess as NewDiagAccess
@@ -19,9 +14,8 @@ spec.loader.exec_module(legacy_mod)
 LegacyDiagAccess = legacy_mod.diagAccess
 
 # Test data files
-DATA_DIR = ROOT / "data"
-CONV_FILE = str(DATA_DIR / "diag_conv_01.2020010100")
-RAD_FILE = str(DATA_DIR / "diag_amsua_n15_01.2020010100")
+CONV_FILE = str(DATA / "diag_conv_01.2020010100")
+RAD_FILE = str(DATA / "diag_amsua_n15_01.2020010100")
 
 # --- Conventional reads ---
 @pytest.mark.benchmark(group="conv_read_legacy")
@@ -1,11 +1,11 @@
-import os
 import pytest
+from conftest import DATA
 from readDiag import diagAccess
 from datetime import datetime
 import warnings
 import pandas as pd
 
-TEST_FILE = os.path.join(os.path.dirname(__file__), "../data/diag_conv_01.2020010100")
+TEST_FILE = str(DATA / "diag_conv_01.2020010100")
 
 def test_get_overview_and_alias():
     diag = diagAccess(TEST_FILE)
@@ -1,24 +1,20 @@
-import os
-import sys
 import pytest
 import pandas as pd
 import numpy as np
 
-# garante que o ROOT (com diagAccess.py) esteja no PYTHONPATH
-ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
-if ROOT not in sys.path:
-    sys.path.insert(0, ROOT)
-
-# importa a classe legacy
+from conftest import DATA
 from readDiag import diagAccess
 
-@pytest.fixture
+CONV_01 = str(DATA / "diag_conv_01.2020010100")
+RAD_N15 = str(DATA / "diag_amsua_n15_01.2020010100")
+
+@pytest.fixture(scope="session")
 def conv_diag():
-    return diagAccess("data/diag_conv_01.2020010100", var="t")
+    return diagAccess(CONV_01, var="t")
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def rad_diag():
-    return diagAccess("data/diag_amsua_n15_01.2020010100", use_memmap=False)
+    return diagAccess(RAD_N15, use_memmap=True)
 
 def test_get_variables(conv_diag):
     vars = conv_diag.get_variables()
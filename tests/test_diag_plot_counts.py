@@ -1,17 +1,15 @@
-import os
 import pytest
-import matplotlib
-matplotlib.use("Agg")  # Backend não interativo para testes
 import matplotlib.pyplot as plt
 
-from readDiag import diagAccess, diagPlotter
+from conftest import DATA
+from readDiag import diagPlotter
 
-TEST_FILE = os.path.join(os.path.dirname(__file__), "../data/diag_conv_01.2020010100")
+TEST_FILE = DATA / "diag_conv_01.2020010100"
 
-@pytest.fixture
-def plotter():
-    diag = diagAccess(TEST_FILE)
-    return diagPlotter(diag)
+@pytest.fixture(scope="module")
+def plotter(read_diag):
+    # o diagAccess vem do cache da sessão (mesmo arquivo de test_plotting)
+    return diagPlotter(read_diag(TEST_FILE))
 
 def test_plot_observation_counts(plotter):
     var = plotter.diag.get_variables()[0]
@@ -1,12 +1,7 @@
-import os
-import sys
+import io
 import pytest
-from pathlib import Path
-
-# Ensure project root in sys.path
-ROOT = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(ROOT))
 
+from conftest import DATA
 from readDiag import diagAccess
 
 
@@ -14,28 +9,21 @@ def test_missing_file():
     """
     Missing file should raise FileNotFoundError.
     """
-    missing = ROOT / 'data' / 'nonexistent_file.bin'
-    with pytest.raises(FileNotFoundError):
+    missing = DATA / 'nonexistent_file.bin'
+    with pytest.raises(FileNotFoundError, match="nonexistent_file.bin"):
         diagAccess(str(missing))
 
 
-def test_empty_file(tmp_path):
-    """
-    Empty file (0 bytes) should raise an exception during header detection.
-    """
-    empty = tmp_path / 'empty.bin'
-    empty.write_bytes(b'')
-    with pytest.raises(ValueError):
-        diagAccess(str(empty))
-
-
-def test_small_rad_file(tmp_path):
+@pytest.mark.parametrize("content,match", [
+    # empty file (0 bytes): fails during header detection
+    (b'', "too small"),
+    # header 5 => treated as rad, but no content => cannot parse header
+    ((5).to_bytes(4, byteorder='big'), "Invalid radiance header"),
+], ids=["empty", "small_rad"])
+def test_invalid_content(content, match):
     """
-    File with 4 bytes not equal to valid conv header should attempt rad read and then fail.
+    Invalid contents should raise ValueError; read from memory, no file needed.
     """
-    small = tmp_path / 'small.bin'
-    # header 5 => treated as rad, but no content => cannot parse header
-    small.write_bytes((5).to_bytes(4, byteorder='big'))
-    with pytest.raises(ValueError):
-        diagAccess(str(small))
+    with pytest.raises(ValueError, match=match):
+        diagAccess(io.BytesIO(content))
 
@@ -0,0 +1,32 @@
+import pytest
+import pandas as pd
+import numpy as np
+
+from conftest import DATA
+from readDiag import diagAccess
+
+CONV_03 = str(DATA / "diag_conv_03.2020010100")
+
+def test_bin_by_kx_matches_stable_argsort():
+    kernels = pytest.importorskip("readDiag._kernels")
+    kx = np.array([187, 120, 187, 181, 120, 120, 199])
+    ks, starts, perm = kernels.bin_by_kx(kx)
+    order = np.argsort(kx, kind="stable")
+    ref_ks, ref_starts = np.unique(kx[order], return_index=True)
+    np.testing.assert_array_equal(perm, order)
+    np.testing.assert_array_equal(ks, ref_ks)
+    np.testing.assert_array_equal(starts[:-1], ref_starts)
+    assert starts[-1] == kx.size
+
+def test_scan_conv_blocks_matches_python_walk(monkeypatch):
+    pytest.importorskip("readDiag._kernels")
+    import readDiag.reader as reader
+    path = CONV_03
+    fast = diagAccess(path, use_memmap=True).get_data_frame()
+    monkeypatch.setattr(reader, "get_kernels", lambda: None)
+    slow = diagAccess(path, use_memmap=True).get_data_frame()
+    assert fast.keys() == slow.keys()
+    for var in fast:
+        assert fast[var].keys() == slow[var].keys()
+        for kx in fast[var]:
+            pd.testing.assert_frame_equal(fast[var][kx], slow[var][kx])
@@ -1,63 +1,74 @@
 # tests/test_plotting.py
+import io
 import os
-import matplotlib
-matplotlib.use("Agg")  # garante backend não-interativo
-
+import struct
 import pytest
 import numpy as np
 import pandas as pd
 from readDiag import diagAccess, diagPlotter
 import matplotlib.pyplot as plt
-import matplotlib.colors
 import matplotlib.colors as mcolors
+from matplotlib.figure import Figure
 
-ROOT = os.path.dirname(os.path.dirname(__file__))
+from conftest import DATA
 
-CONV_FILE = os.path.join(ROOT, "data", "diag_conv_01.2020010100")
-RAD_FILE = os.path.join(ROOT, "data", "diag_amsua_n15_01.2020010100")
+CONV_FILE = DATA / "diag_conv_01.2020010100"
+RAD_FILE = DATA / "diag_amsua_n15_01.2020010100"
 
 
-def test_plot_conv_hist_and_box(tmp_path):
+@pytest.mark.slow
+def test_plot_conv_hist_and_box(read_diag):
     """Smoke test: histogram e boxplot para dados convencionais."""
-    da = diagAccess(CONV_FILE)
+    da = read_diag(CONV_FILE)
     df_dict = da.get_data_frame()
     assert df_dict
     var = next(iter(df_dict.keys()))
     kx = next(iter(df_dict[var].keys()))
 
     plotter = diagPlotter(da)
-    ax1 = plotter.plot_hist_conv(var, kx, col="omf", savepath=tmp_path / "hist.png")
-    ax2 = plotter.plot_boxplot_kxs_conv(var, col="omf", savepath=tmp_path / "box.png")
-    assert (tmp_path / "hist.png").exists()
-    assert (tmp_path / "box.png").exists()
+    hist, box = io.BytesIO(), io.BytesIO()
+    ax1 = plotter.plot_hist_conv(var, kx, col="omf", savepath=hist)
+    ax2 = plotter.plot_boxplot_kxs_conv(var, col="omf", savepath=box)
+    assert hist.getvalue().startswith(b"\x89PNG")
+    assert box.tell() > 0
     assert ax1 is not None and ax2 is not None
 
 
-def test_plot_rad_metrics(tmp_path):
+@pytest.mark.slow
+def test_plot_rad_metrics(read_diag):
     """Smoke test: estatística de canais e distribuição O-F para radiância."""
-    da = diagAccess(RAD_FILE)
+    da = read_diag(RAD_FILE)
     plotter = diagPlotter(da)
 
-    ax1 = plotter.plot_channel_stats_rad(metric="omf", agg="mean",
-                                         savepath=tmp_path / "stats.png")
-    ax2 = plotter.plot_omf_distribution_rad(0, corrected=False,
-                                            savepath=tmp_path / "omf_hist.png")
-    assert (tmp_path / "stats.png").exists()
-    assert (tmp_path / "omf_hist.png").exists()
+    stats, omf_hist = io.BytesIO(), io.BytesIO()
+    ax1 = plotter.plot_channel_stats_rad(metric="omf", agg="mean", savepath=stats)
+    ax2 = plotter.plot_omf_distribution_rad(0, corrected=False, savepath=omf_hist)
+    assert stats.tell() > 0
+    assert omf_hist.tell() > 0
     assert ax1 is not None and ax2 is not None
 
 
 # ------------------------------------------------------------------
 # Novos testes para customização via kwargs e decorador
 # ------------------------------------------------------------------
+# Dados falsos montados uma única vez; os plots só os leem (os arrays vindos
+# de bytes são somente leitura, então uma mutação acidental falha na hora)
+def _f8(*values):
+    return np.frombuffer(struct.pack(f'<{len(values)}d', *values), dtype='<f8')
+
+_CONV_DF = pd.DataFrame({'omf': _f8(1.0, 2.0, 3.0)})
+_CONV_TREE = {'temp': {1: _CONV_DF}}
+_RAD_DF1 = pd.DataFrame({'omf': _f8(0.5, 0.6), 'omf_nbc': _f8(0.4, 0.7)})
+_RAD_DF2 = pd.DataFrame({'omf': _f8(1.5, 1.6), 'omf_nbc': _f8(1.4, 1.7)})
+_RAD_TREE = {'dataframes': {'diagbufchan_df': [_RAD_DF1, _RAD_DF2]}}
+
 class FakeDiagConv(diagAccess):
     def __init__(self):
         pass
     def get_data_type(self):
         return 1
     def get_data_frame(self):
-        df = pd.DataFrame({'omf': np.array([1.0, 2.0, 3.0])})
-        return {'temp': {1: df}}
+        return _CONV_TREE
 
 class FakeDiagRad(diagAccess):
     def __init__(self):
@@ -65,15 +76,29 @@ class FakeDiagRad(diagAccess):
     def get_data_type(self):
         return 2
     def get_data_frame(self):
-        df1 = pd.DataFrame({'omf': np.array([0.5, 0.6]), 'omf_nbc': np.array([0.4, 0.7])})
-        df2 = pd.DataFrame({'omf': np.array([1.5, 1.6]), 'omf_nbc': np.array([1.4, 1.7])})
-        return {'dataframes': {'diagbufchan_df': [df1, df2]}}
+        return _RAD_TREE
 
 @pytest.fixture(autouse=True)
 def no_warnings(monkeypatch):
     monkeypatch.setenv('PYTHONWARNINGS', 'ignore')
 
 
+@pytest.fixture(scope="module")
+def _shared_figure():
+    # Figure fora do pyplot: o plt.close('all') do conftest não a fecha
+    fig = Figure()
+    fig.subplots()
+    return fig
+
+
+@pytest.fixture
+def shared_ax(_shared_figure):
+    """Axes reaproveitado entre os testes do módulo, limpo a cada uso."""
+    ax = _shared_figure.axes[0]
+    ax.cla()
+    return ax
+
+
 def test_plot_hist_conv_custom_kwargs(monkeypatch):
     monkeypatch.setattr('readDiag.diagAccess', FakeDiagConv)
     diag = FakeDiagConv()
@@ -89,32 +114,106 @@ def test_plot_hist_conv_custom_kwargs(monkeypatch):
     assert ax.get_xlabel() == 'Value'
     assert ax.get_ylabel() == 'Count'
 
-    exp_hex = mcolors.to_hex(mcolors.to_rgba('red', 0.5), keep_alpha=True)
-    for p in ax.patches:
-        assert mcolors.to_hex(p.get_facecolor(), keep_alpha=True) == exp_hex
+    # todas as cores de uma vez, como matriz (N, 4) RGBA
+    cols = np.array([p.get_facecolor() for p in ax.patches])
+    assert cols.shape == (len(ax.patches), 4)
+    np.testing.assert_allclose(cols, np.broadcast_to(mcolors.to_rgba('red', 0.5), cols.shape))
         
+def test_plot_hist_conv_caps_bins(monkeypatch):
+    monkeypatch.setattr('readDiag.diagAccess', FakeDiagConv)
+    plotter = diagPlotter(FakeDiagConv())
+    with pytest.warns(RuntimeWarning, match="bins=1000") as rec:
+        ax = plotter.plot_hist_conv('temp', 1, bins=1000)
+    assert len(ax.patches) == 10
+    # o aviso aponta para a chamada do usuário, não para o wrapper interno
+    assert rec[0].filename == __file__
+
+def test_quartiles_partition():
+    from readDiag.plotting import _quartiles
+    a = np.arange(101, dtype=float)[::-1].copy()
+    assert _quartiles(a) == (0.0, 25.0, 50.0, 75.0, 100.0)
+
+@pytest.mark.parametrize("kwargs", [
+    {"showmeans": True},
+    {"notch": True},
+    {"sym": ""},
+    {"whis": (5, 95)},
+])
+def test_plot_boxplot_accepts_boxplot_kwargs(monkeypatch, shared_ax, kwargs):
+    monkeypatch.setattr('readDiag.diagAccess', FakeDiagConv)
+    plotter = diagPlotter(FakeDiagConv())
+    ax = plotter.plot_boxplot_kxs_conv('temp', ax=shared_ax, **kwargs)
+    assert ax is shared_ax and ax.lines
+
+def test_bxp_stats_percentile_whiskers():
+    # mesmos bigodes que o Axes.boxplot para whis em percentis
+    from matplotlib.cbook import boxplot_stats
+    from readDiag.plotting import _bxp_stats
+    a = np.random.default_rng(0).normal(size=200)
+    ref = boxplot_stats(a, whis=(5, 95))[0]
+    got = _bxp_stats(a, whis=(5, 95))
+    for key in ("mean", "whislo", "whishi"):
+        assert got[key] == pytest.approx(ref[key])
+    np.testing.assert_array_equal(np.sort(got["fliers"]), np.sort(ref["fliers"]))
+
+@pytest.mark.slow
+def test_recycle_figures(monkeypatch, tmp_path):
+    monkeypatch.setattr('readDiag.diagAccess', FakeDiagConv)
+    monkeypatch.setattr(diagPlotter, 'recycle_figures', True)
+    plotter = diagPlotter(FakeDiagConv())
+    ax1 = plotter.plot_hist_conv('temp', 1, bins=3, savepath=tmp_path / "a.png")
+    ax2 = plotter.plot_hist_conv('temp', 1, bins=3, savepath=tmp_path / "b.png")
+    assert ax1 is ax2
+    # uma única leitura do diretório confere os dois arquivos
+    assert {e.name for e in os.scandir(tmp_path)} >= {"a.png", "b.png"}
+    diagPlotter.close_all_pooled()
+    assert not diagPlotter._FIG_POOL
+
+def test_grid_figure_not_recycled(monkeypatch):
+    # grade de um canal tem um só Axes, mas o suptitle não pode vazar
+    monkeypatch.setattr('readDiag.diagAccess', FakeDiagRad)
+    monkeypatch.setattr(diagPlotter, 'recycle_figures', True)
+    plotter = diagPlotter(FakeDiagRad())
+    try:
+        grid = plotter.plot_omf_grid_rad([0], bins=3, savepath=io.BytesIO())
+        ax = plotter.plot_omf_distribution_rad(1, bins=3)
+        assert ax.get_figure() is not grid[0, 0].get_figure()
+        assert ax.get_figure().get_suptitle() == ''
+    finally:
+        diagPlotter.close_all_pooled()
+
+def test_hist_fast_fused_kernel(monkeypatch):
+    pytest.importorskip("numba")
+    from readDiag import plotting
+    monkeypatch.setattr(plotting, "_FUSED_HIST_SIZE", 0)
+    values = np.array([0.0, 0.5, np.nan, 1.0, 2.0, 3.0, np.nan, 4.0])
+    counts, edges = plotting._hist_fast(values, 4)
+    exp_counts, exp_edges = np.histogram(values[~np.isnan(values)], 4)
+    np.testing.assert_array_equal(counts, exp_counts)
+    np.testing.assert_allclose(edges, exp_edges)
+
 @pytest.mark.parametrize("method,args", [
     ('plot_boxplot_kxs_conv', ('temp',)),
     ('plot_observation_counts', ('temp',)),
     ('plot_kx_count', ()),
     ('plot_variable_count', ()),
 ])
-def test_conv_methods_no_error(monkeypatch, method, args):
+def test_conv_methods_no_error(monkeypatch, shared_ax, method, args):
     monkeypatch.setattr('readDiag.diagAccess', FakeDiagConv)
     diag = FakeDiagConv()
     plotter = diagPlotter(diag)
     func = getattr(plotter, method)
-    ax = func(*args, color='green', title='Test', xlabel='X', ylabel='Y')
+    ax = func(*args, ax=shared_ax, color='green', title='Test', xlabel='X', ylabel='Y')
     assert isinstance(ax, plt.Axes)
     assert ax.get_title() == 'Test'
 
 
-def test_plot_channel_stats_rad(monkeypatch):
+def test_plot_channel_stats_rad(monkeypatch, shared_ax):
     monkeypatch.setattr('readDiag.diagAccess', FakeDiagRad)
     diag = FakeDiagRad()
     plotter = diagPlotter(diag)
     ax = plotter.plot_channel_stats_rad(
-        metric='omf', agg='mean', marker='x', color='blue',
+        ax=shared_ax, metric='omf', agg='mean', marker='x', color='blue',
         title='Rad Mean', xlabel='Ch', ylabel='Mean'
     )
     assert isinstance(ax, plt.Axes)
@@ -122,12 +221,12 @@ def test_plot_channel_stats_rad(monkeypatch):
     assert len(lines) == 1
 
 
-def test_plot_omf_distribution_rad(monkeypatch):
+def test_plot_omf_distribution_rad(monkeypatch, shared_ax):
     monkeypatch.setattr('readDiag.diagAccess', FakeDiagRad)
     diag = FakeDiagRad()
     plotter = diagPlotter(diag)
     ax = plotter.plot_omf_distribution_rad(
-        1, corrected=True, bins=2, color='purple', alpha=0.7,
+        1, ax=shared_ax, corrected=True, bins=2, color='purple', alpha=0.7,
         title='Rad Hist', xlabel='O-F', ylabel='Freq'
     )
     assert isinstance(ax, plt.Axes)
@@ -137,6 +236,16 @@ def test_plot_omf_distribution_rad(monkeypatch):
     assert len(ax.patches) > 0
 
 
+@pytest.mark.slow
+def test_plot_omf_grid_rad(monkeypatch, tmp_path):
+    monkeypatch.setattr('readDiag.diagAccess', FakeDiagRad)
+    plotter = diagPlotter(FakeDiagRad())
+    axes = plotter.plot_omf_grid_rad(bins=2, ncols=4, savepath=tmp_path / "grid.png")
+    assert axes.shape == (1, 2)
+    assert all(len(ax.patches) == 2 for ax in axes.flat)
+    assert (tmp_path / "grid.png").exists()
+
+
 def test_check_kind_decorator(monkeypatch):
     monkeypatch.setattr('readDiag.diagAccess', FakeDiagConv)
     diag = FakeDiagConv()
@@ -1,32 +1,21 @@
-import os
-import sys
 import pytest
 import pandas as pd
 from datetime import datetime
 
-# garante que o ROOT (com diagAccess.py) esteja no PYTHONPATH
-ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
-if ROOT not in sys.path:
-    sys.path.insert(0, ROOT)
-
-import os
-import pytest
-import pandas as pd
-from datetime import datetime
+from conftest import DATA
 from readDiag import diagAccess
 
 
 TEST_FILES = [
-    "data/diag_conv_01.2020010100",
-    "data/diag_conv_03.2020010100",
-    "data/diag_amsua_n15_01.2020010100",
-    "data/diag_amsua_n15_03.2020010100",
+    "diag_conv_01.2020010100",
+    "diag_conv_03.2020010100",
+    "diag_amsua_n15_01.2020010100",
+    "diag_amsua_n15_03.2020010100",
 ]
 
-@pytest.mark.parametrize("relpath", TEST_FILES)
-def test_read_baseline(relpath):
-    path = os.path.join(ROOT, relpath)
-    diag = diagAccess(path)
+@pytest.mark.parametrize("diag_file", TEST_FILES, indirect=True)
+def test_read_baseline(diag_file):
+    diag = diag_file
     df_dict = diag.get_data_frame()
 
     # [1] Estrutura básica
@@ -38,13 +27,12 @@ def test_read_baseline(relpath):
     assert isinstance(dt, datetime), "get_date() deve retornar um datetime"
     assert dt == datetime(2020, 1, 1, 0), f"Data incorreta: esperava 2020-01-01 00:00, veio {dt}"
 
-    if "diag_conv" in relpath:
+    if diag.get_data_type() == 1:
         # [3] Estrutura convencional: var → kx → DataFrame
-        for var, kx_block in df_dict.items():
-            assert isinstance(kx_block, dict), f"Esperado dict para '{var}', veio {type(kx_block)}"
-            for kx, df in kx_block.items():
-                assert isinstance(df, pd.DataFrame), f"{var}[{kx}] não é DataFrame"
-                assert not df.empty, f"{var}[{kx}] está vazio"
+        assert all(type(blk) is dict for blk in df_dict.values()), "Esperado dict var → kx"
+        frames = [df for kx_block in df_dict.values() for df in kx_block.values()]
+        assert all(type(df) is pd.DataFrame for df in frames), "Há blocos que não são DataFrame"
+        assert all(df.shape[0] > 0 for df in frames), "Há DataFrames vazios"
 
     else:
         # [4] Estrutura radiância: sensor/kx/dataframes
@@ -55,3 +43,25 @@ def test_read_baseline(relpath):
         assert isinstance(dfs, dict), "'dataframes' deve ser um dicionário"
         assert any(isinstance(df, pd.DataFrame) for df in dfs.values()), "Nenhum DataFrame encontrado"
 
+
+
+def _frames(df_dict):
+    if "dataframes" in df_dict:
+        dfs = df_dict["dataframes"]
+        yield dfs["channel_df"]
+        yield dfs["diagbuf_df"]
+        yield dfs["diagbufex_df"]
+        yield from dfs["diagbufchan_df"]
+    else:
+        for kx_block in df_dict.values():
+            yield from kx_block.values()
+
+
+@pytest.mark.parametrize("use_memmap", [False, True])
+@pytest.mark.parametrize("name", TEST_FILES)
+def test_read_native_byte_order(name, use_memmap):
+    """Os dados big-endian do arquivo devem chegar ao usuário em ordem nativa."""
+    diag = diagAccess(DATA / name, use_memmap=use_memmap)
+    wrong = [(name, dt.str) for df in _frames(diag.get_data_frame())
+             for name, dt in df.dtypes.items() if dt.kind in "fiu" and not dt.isnative]
+    assert not wrong, f"colunas fora da ordem nativa: {wrong}"
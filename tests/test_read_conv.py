@@ -0,0 +1,69 @@
+import pytest
+import pandas as pd
+import numpy as np
+
+from conftest import DATA, write_conv_file
+from readDiag import diagAccess
+
+CONV_01 = str(DATA / "diag_conv_01.2020010100")
+RAD_N15 = str(DATA / "diag_amsua_n15_01.2020010100")
+
+@pytest.fixture(scope="session")
+def conv_diag():
+    return diagAccess(CONV_01, var="t")
+
+def test_conv_memmap_matches_fromfile():
+    path = CONV_01
+    ref = diagAccess(path, use_memmap=False).get_data_frame()
+    mm = diagAccess(path, use_memmap=True).get_data_frame()
+    assert ref.keys() == mm.keys()
+    for var in ref:
+        assert ref[var].keys() == mm[var].keys()
+        for kx in ref[var]:
+            pd.testing.assert_frame_equal(ref[var][kx], mm[var][kx])
+
+def test_dataframes_built_lazily_and_memoized(conv_diag):
+    kx = conv_diag.get_kx_list("t")[0]
+    df = conv_diag.get_dataframe("t", kx)
+    assert conv_diag.get_dataframe("t", kx) is df
+    assert conv_diag.get_data_frame()["t"][kx] is df
+    assert conv_diag.get_data_frame() is conv_diag.get_data_frame()
+
+def test_conv_frame_shares_raw_memory(conv_diag):
+    # os DataFrames são views dos arrays lidos, sem cópia do payload
+    kx = conv_diag.get_kx_list("t")[0]
+    raw = conv_diag._raw["t"][kx]
+    df = conv_diag.get_dataframe("t", kx)
+    assert all(np.shares_memory(df[c].to_numpy(), raw) for c in df.columns)
+    np.testing.assert_array_equal(df["lat"].to_numpy(), raw[:, 1])
+
+def test_use_arrow_backend():
+    pytest.importorskip("pyarrow")
+    diag = diagAccess(CONV_01, var="t", use_arrow=True)
+    df = diag.get_dataframe("t", diag.get_kx_list("t")[0])
+    assert all(isinstance(dt, pd.ArrowDtype) for dt in df.dtypes)
+    ch = diagAccess(RAD_N15, use_arrow=True).get_data_frame()["dataframes"]["channel_df"]
+    assert all(isinstance(dt, pd.ArrowDtype) for dt in ch.dtypes)
+
+@pytest.mark.parametrize("use_kernels", [False, True])
+@pytest.mark.parametrize("use_memmap", [False, True])
+def test_kx_rows_accumulate_across_blocks_in_file_order(tmp_path, monkeypatch, use_memmap, use_kernels):
+    import readDiag.reader as reader
+    if use_kernels:
+        pytest.importorskip("readDiag._kernels")
+    else:
+        # exercise the NumPy stable-argsort grouping
+        monkeypatch.setattr(reader, "get_kernels", lambda: None)
+    rng = np.random.default_rng(0)
+    b1 = rng.random((5, 19), dtype=np.float32)
+    b2 = rng.random((4, 19), dtype=np.float32)
+    b1[:, 0] = [120, 180, 120, 120, 180]
+    b2[:, 0] = [180, 120, 120, 180]
+    path = tmp_path / "diag_conv_synthetic"
+    write_conv_file(path, [("t", b1), ("t", b2)])
+    diag = diagAccess(str(path), use_memmap=use_memmap)
+    both = np.concatenate([b1, b2])
+    for kx in (120, 180):
+        expected = both[both[:, 0] == kx, 1:]
+        np.testing.assert_array_equal(diag.get_dataframe("t", kx).to_numpy(), expected)
+    assert diag.get_kx_counts("t") == {120: 5, 180: 4}
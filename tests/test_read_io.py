@@ -0,0 +1,39 @@
+import pytest
+import pandas as pd
+
+from conftest import DATA
+from readDiag import diagAccess
+
+CONV_01 = str(DATA / "diag_conv_01.2020010100")
+RAD_N15 = str(DATA / "diag_amsua_n15_01.2020010100")
+
+@pytest.mark.parametrize("path", [CONV_01, RAD_N15])
+def test_file_opened_once(monkeypatch, path):
+    # detecção de formato e leitura usam o mesmo handle
+    import builtins
+    import readDiag.reader as reader
+    opened = []
+    def counting_open(name, *args, **kwargs):
+        opened.append(name)
+        return builtins.open(name, *args, **kwargs)
+    monkeypatch.setattr(reader, "open", counting_open, raising=False)
+    diagAccess(path)
+    assert opened == [path]
+
+@pytest.mark.parametrize("path", [CONV_01, RAD_N15])
+def test_read_from_bytesio(path):
+    import io
+    with open(path, "rb") as f:
+        buf = io.BytesIO(f.read())
+    ref = diagAccess(path, use_memmap=False)
+    mem = diagAccess(buf)
+    assert not buf.closed
+    assert mem.get_data_type() == ref.get_data_type()
+    assert mem.get_date() == ref.get_date()
+    if ref.get_data_type() == 1:
+        kx = ref.get_kx_list("t")[0]
+        pd.testing.assert_frame_equal(mem.get_dataframe("t", kx), ref.get_dataframe("t", kx))
+    else:
+        a, b = ref.get_data_frame()["dataframes"], mem.get_data_frame()["dataframes"]
+        pd.testing.assert_frame_equal(b["diagbuf_df"], a["diagbuf_df"])
+        pd.testing.assert_frame_equal(b["diagbufchan_df"][0], a["diagbufchan_df"][0])
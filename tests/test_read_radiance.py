@@ -1,38 +1,33 @@
-import os
-import sys
 import pytest
+import numpy as np
 import pandas as pd
 from readDiag import diagAccess
 from datetime import datetime
 
-# Garante que o diretório ROOT (raiz do projeto) esteja no sys.path
-ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
-if ROOT not in sys.path:
-    sys.path.insert(0, ROOT)
+from conftest import DATA
 
 RAD_FILES = [
-    "data/diag_amsua_metop-a_01.2020010100",
-    "data/diag_amsua_metop-a_03.2020010100",
-    "data/diag_amsua_n15_01.2020010100",
-    "data/diag_amsua_n15_03.2020010100",
-    "data/diag_amsua_n18_01.2020010100",
-    "data/diag_amsua_n18_03.2020010100",
-    "data/diag_amsua_n19_01.2020010100",
-    "data/diag_amsua_n19_03.2020010100",
+    "diag_amsua_metop-a_01.2020010100",
+    "diag_amsua_metop-a_03.2020010100",
+    "diag_amsua_n15_01.2020010100",
+    "diag_amsua_n15_03.2020010100",
+    "diag_amsua_n18_01.2020010100",
+    "diag_amsua_n18_03.2020010100",
+    "diag_amsua_n19_01.2020010100",
+    "diag_amsua_n19_03.2020010100",
 ]
 
-@pytest.mark.parametrize("relpath", RAD_FILES)
-def test_radiance_structure(relpath):
-    path = os.path.join(ROOT, relpath)
-    diag = diagAccess(path)
+@pytest.mark.parametrize("diag_file", RAD_FILES, indirect=True)
+def test_radiance_structure(diag_file):
+    diag = diag_file
     df = diag.get_data_frame()
 
     # [1] Tipo de dado deve ser radiância
     assert diag.get_data_type() == 2, "Esperado data_type=2 para arquivos de radiância"
 
     # [2] Estrutura de topo deve conter 'sensor', 'kx' e 'dataframes'
-    for key in ["sensor", "kx", "dataframes"]:
-        assert key in df, f"'{key}' ausente na estrutura de topo para radiância"
+    missing = {"sensor", "kx", "dataframes"} - df.keys()
+    assert not missing, f"{sorted(missing)} ausente(s) na estrutura de topo para radiância"
 
     nested = df["dataframes"]
 
@@ -51,9 +46,9 @@ def test_radiance_structure(relpath):
     dbc = nested.get("diagbufchan_df")
     assert isinstance(dbc, list), "'diagbufchan_df' deve ser uma lista"
     assert len(dbc) == nchanl, "diagbufchan_df deve conter um DataFrame por canal"
-    for i, df_chan in enumerate(dbc):
-        assert isinstance(df_chan, pd.DataFrame), f"Canal {i} não é DataFrame"
-        assert not df_chan.empty, f"Canal {i} está vazio"
+    assert all(type(df_chan) is pd.DataFrame for df_chan in dbc), "Há canais que não são DataFrame"
+    sizes = np.fromiter((df_chan.shape[0] for df_chan in dbc), dtype=np.int64, count=len(dbc))
+    assert sizes.min() > 0, f"Canais vazios: {np.flatnonzero(sizes == 0).tolist()}"
 
     # [6] Estrutura 'diagbufex_df'
     dbe = nested.get("diagbufex_df")
@@ -65,3 +60,47 @@ def test_radiance_structure(relpath):
     assert isinstance(dt, datetime), "get_date() deve retornar datetime"
     assert dt == datetime(2020, 1, 1, 0), f"Data incorreta: {dt}"
 
+
+def test_radiance_channel_frames_are_views():
+    # in-memory reads are swapped in place, so channel frames can be views
+    diag = diagAccess(DATA / RAD_FILES[2], use_memmap=False)
+    dbc = diag.get_data_frame()["dataframes"]["diagbufchan_df"]
+    a = dbc[0]["omf"].to_numpy()
+    b = dbc[1]["omf"].to_numpy()
+    # both channels are strided views of the same (nobs, nchanl, total) buffer
+    assert a.base is not None
+    assert np.may_share_memory(a, b)
+
+
+def test_radiance_memmap_matches_fromfile():
+    path = DATA / RAD_FILES[0]
+    ref = diagAccess(path, use_memmap=False).get_data_frame()["dataframes"]
+    mm = diagAccess(path, use_memmap=True).get_data_frame()["dataframes"]
+    pd.testing.assert_frame_equal(ref["diagbuf_df"], mm["diagbuf_df"])
+    pd.testing.assert_frame_equal(ref["diagbufex_df"], mm["diagbufex_df"])
+    for a, b in zip(ref["diagbufchan_df"], mm["diagbufchan_df"]):
+        pd.testing.assert_frame_equal(a, b)
+        assert all(dt.isnative for dt in b.dtypes)
+
+
+def test_radiance_without_extra_block(tmp_path):
+    """Arquivos com iextra == 0 não têm bloco extra e devem ser lidos."""
+    diagAccess._init_dtypes()
+    hdr = np.zeros(1, diagAccess.header_info_dtype)
+    hdr["head"] = hdr.itemsize - 8
+    hdr["obstype"], hdr["dplat"] = b"amsua", b"n15"
+    hdr["nchanl"], hdr["npred"], hdr["idate"] = 2, 1, 2020010100
+    hdr["ireal"], hdr["ipchan"], hdr["iextra"], hdr["jextra"] = 26, 8, 0, 0
+    chans = np.zeros(2, diagAccess.channel_info_dtype)
+    dt = diagAccess._diag_record_dtype(26, (8 + 1 + 2) * 2, 0)
+    assert "dbe" not in dt.names
+    assert dt.itemsize == 4 + 4 * 26 + 4 * 22 + 4
+    recs = np.zeros(3, dt)
+    recs["db"] = np.arange(3 * 26, dtype=np.float32).reshape(3, 26)
+    path = tmp_path / "diag_rad_noextra"
+    path.write_bytes(hdr.tobytes() + chans.tobytes() + recs.tobytes())
+
+    dfs = diagAccess(str(path)).get_data_frame()["dataframes"]
+    np.testing.assert_array_equal(dfs["diagbuf_df"]["lat"], [0, 26, 52])
+    assert len(dfs["diagbufchan_df"]) == 2
+    assert dfs["diagbufex_df"].shape == (3, 0)
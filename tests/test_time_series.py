@@ -0,0 +1,59 @@
+import pytest
+import pandas as pd
+import numpy as np
+
+from conftest import DATA, write_conv_file
+from readDiag import diagAccess
+
+CONV_01 = str(DATA / "diag_conv_01.2020010100")
+CONV_03 = str(DATA / "diag_conv_03.2020010100")
+
+def test_read_time_series_conv():
+    files = [CONV_01, CONV_03]
+    df = diagAccess.read_time_series(files, var="t", n_workers=2)
+    assert isinstance(df, pd.DataFrame)
+    assert {"channel", "date"} <= set(df.columns)
+    df_thr = diagAccess.read_time_series(files, var="t", n_workers=2, use_threads=True)
+    pd.testing.assert_frame_equal(df, df_thr)
+
+def test_read_time_series_matches_concat():
+    files = [CONV_01, CONV_03]
+    df = diagAccess.read_time_series(files, var="t", n_workers=1, use_threads=True)
+    parts = []
+    for path in files:
+        rd = diagAccess(path, var="t")
+        for kx, part in rd.get_data_frame()["t"].items():
+            parts.append(part.assign(channel=kx, date=rd.get_date()))
+    expected = pd.concat(parts, ignore_index=True)
+    expected["channel"] = pd.Categorical(expected["channel"])
+    expected["date"] = expected["date"].astype("datetime64[s]")
+    pd.testing.assert_frame_equal(df, expected)
+
+def test_time_series_channel_categories_merged(tmp_path):
+    # arquivos com conjuntos de kx diferentes: a coluna continua categórica
+    paths = []
+    for i, kxs in enumerate([[180, 120, 180], [130, 120]]):
+        rows = np.zeros((len(kxs), 19), dtype=np.float32)
+        rows[:, 0] = kxs
+        paths.append(str(tmp_path / f"diag_conv_{i}"))
+        write_conv_file(paths[-1], [("t", rows)])
+    df = diagAccess.read_time_series(paths, var="t", n_workers=1, use_threads=True)
+    assert isinstance(df["channel"].dtype, pd.CategoricalDtype)
+    assert list(df["channel"].cat.categories) == [120, 130, 180]
+    assert list(df["channel"]) == [120, 180, 180, 120, 130]
+    assert df["date"].dtype == "datetime64[s]"
+
+def test_iter_time_series_in_file_order():
+    files = [CONV_01, CONV_03] * 3
+    parts = list(diagAccess.iter_time_series(files, var="t", n_workers=2, use_threads=True))
+    assert len(parts) == len(files)
+    pd.testing.assert_frame_equal(parts[0], parts[2])
+    whole = diagAccess.read_time_series(files, var="t", n_workers=2, use_threads=True)
+    pd.testing.assert_frame_equal(pd.concat(parts, ignore_index=True), whole)
+
+def test_read_time_series_arrow():
+    pytest.importorskip("pyarrow")
+    df = diagAccess.read_time_series([CONV_01, CONV_03], var="t", n_workers=1,
+                                     use_threads=True, use_arrow=True)
+    assert isinstance(df["channel"].dtype, pd.CategoricalDtype)
+    assert all(isinstance(dt, pd.ArrowDtype) for dt in df.dtypes.drop("channel"))